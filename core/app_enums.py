@@ -1,8 +1,12 @@
-from enum import Enum
+from enum import IntFlag
 
-class AppMode(Enum):
+class AppMode(IntFlag):
     """Application states for better state management."""
-    READY = "ready"
-    RECORDING = "recording"
-    PAUSED = "paused"
-    EDITING = "editing"
+    READY = 1
+    RECORDING = 2
+    PAUSED = 4
+    EDITING = 8
+
+
+# Modes in which a capture session is active (recording or paused)
+RECORDING_MODES = AppMode.RECORDING | AppMode.PAUSED
@@ -1,11 +1,16 @@
 import os
 from typing import List, Optional
-from utils.qt_imports import *
+from utils.qt_imports import (
+    QApplication, QCheckBox, QCloseEvent, QComboBox, QDialog, QFormLayout, QFrame,
+    QGroupBox, QHBoxLayout, QImage, QLabel, QMainWindow, QMessageBox, QMouseEvent,
+    QMoveEvent, QPaintEvent, QPainter, QPlainTextEdit, QPoint, QPushButton, QRect,
+    QRegion, QResizeEvent, QSize, QSizeGrip, QSizePolicy, QSlider, QSpacerItem,
+    QSpinBox, QTabWidget, QTimer, QVBoxLayout, QWidget, Qt, pyqtSignal, QT_VERSION
+)
 from utils.constants import *
 from core.recording_timer import RecordingTimer
-from utils.gif_saver import save_gif_from_frames
 from pynput import keyboard
-from core.app_enums import AppMode
+from core.app_enums import AppMode, RECORDING_MODES
 from core.data_classes import *
 from managers.ui_manager import UIManager
 from managers.hotkey_manager import HotkeyManager
@@ -22,6 +27,7 @@ class GifRecorderMainWindow(QMainWindow):
     pause_signal = pyqtSignal()
     stop_signal = pyqtSignal()
     record_frame_signal = pyqtSignal()
+    settings_loaded = pyqtSignal()
 
 
     def __init__(self):
@@ -30,7 +36,6 @@ class GifRecorderMainWindow(QMainWindow):
 
         self.frames: List[QImage] = []
         self.drag_pos = QPoint()
-        self._last_mode_was_edit = True
         self._is_closing = False
         self._saved_window_size: Optional[QSize] = None
         self._saved_window_pos: Optional[QPoint] = None
@@ -58,7 +63,9 @@ class GifRecorderMainWindow(QMainWindow):
         self._setup_hotkeys()
 
         self.cmd_executor = CMDExecuter(default_timeout=60)
-        self.ui_manager.update_for_mode(AppMode.READY)
+        # Applied right away, before the first paint of the already shown window
+        with self.ui_manager.batch():
+            self.ui_manager.update_for_mode(AppMode.READY, force=True)
         QTimer.singleShot(0, self._initial_fix)
 
     def _init_ui(self) -> None:
@@ -287,12 +294,12 @@ class GifRecorderMainWindow(QMainWindow):
         # Frame was already deleted from preview_widget.frames
         # Just update our own frames list
         self.frames = self.preview_widget.frames.copy()
-        self.update_status_label()
+        self.ui_manager.refresh_status()
 
     def _on_frames_updated(self, updated_frames: List[QImage]):
         """Handle frames update from preview widget."""
         self.frames = updated_frames.copy()
-        self.update_status_label()
+        self.ui_manager.refresh_status()
 
     def _add_size_grip(self) -> None:
         sizegrip_layout = QHBoxLayout()
@@ -325,8 +332,19 @@ class GifRecorderMainWindow(QMainWindow):
         self.stop_signal.connect(self._on_stop_clicked)
         self.record_frame_signal.connect(self._on_record_frame_clicked)
 
+        # Settings are restored with signals blocked, sync dependent widgets once
+        self.settings_loaded.connect(self._on_settings_loaded)
+
         QApplication.instance().aboutToQuit.connect(self._cleanup_resources)
 
+    def _on_settings_loaded(self) -> None:
+        """Sync labels and enabled states that normally follow the quality widgets."""
+        similarity_enabled = self.similarity_check.isChecked()
+        self.similarity_slider.setEnabled(similarity_enabled)
+        self.similarity_label.setEnabled(similarity_enabled)
+        self.similarity_label.setText(f"{self.similarity_slider.value()}%")
+        self.lossy_level_label.setText(str(self.lossy_level_slider.value()))
+
     def _show_config_dialog(self) -> None:
         """Show configuration dialog."""
         dialog = ConfigDialog(self, self.hotkey_manager.config)
@@ -339,7 +357,7 @@ class GifRecorderMainWindow(QMainWindow):
             self.hotkey_manager.cleanup()
 
             # Update configuration
-            self.hotkey_manager.config = new_config
+            self.hotkey_manager.set_config(new_config)
 
             # Setup new hotkeys
             success = self.hotkey_manager.setup()
@@ -424,7 +442,7 @@ class GifRecorderMainWindow(QMainWindow):
         if self._is_closing:
             return
         
-        if self.recording_manager.mode in [AppMode.RECORDING, AppMode.PAUSED]:
+        if self.recording_manager.mode & RECORDING_MODES:
             self.recording_manager.toggle_pause()
             self.ui_manager.update_for_mode(self.recording_manager.mode)
 
@@ -458,7 +476,7 @@ class GifRecorderMainWindow(QMainWindow):
         if self._is_closing:
             return
         
-        if self.recording_manager.mode in [AppMode.RECORDING, AppMode.PAUSED]:
+        if self.recording_manager.mode & RECORDING_MODES:
             self._stop_recording()
     
     def _on_save_clicked(self) -> None:
@@ -480,27 +498,29 @@ class GifRecorderMainWindow(QMainWindow):
     
     def _stop_recording(self) -> None:
         """Stoppt Aufnahme und wechselt in Edit-Modus"""
-        self.recording_manager.stop()
-        
-        if self.frames:
-            self.preview_widget.set_frames(self.frames, self.fps_spin.value())
-        
-        self.ui_manager.update_for_mode(self.recording_manager.mode)
+        with self.ui_manager.batch():
+            self.recording_manager.stop()
+
+            if self.frames:
+                self.preview_widget.set_frames(self.frames, self.fps_spin.value())
+
+            self.ui_manager.update_for_mode(self.recording_manager.mode)
     
     def add_frame(self, image: QImage) -> None:
         self.frames.append(image)
-        self.update_status_label()
+        self.ui_manager.refresh_status()
     
     def clear_frames(self, confirm: bool = True) -> None:
         if not self.frames and confirm:
             self.ui_manager.update_for_mode(AppMode.READY)
             return
         
-        self.frames.clear()
-        self.preview_widget.set_frames([], self.fps_spin.value())
-        self.recording_manager._mode = AppMode.READY
+        with self.ui_manager.batch():
+            self.frames.clear()
+            self.preview_widget.set_frames([], self.fps_spin.value())
+            self.recording_manager._mode = AppMode.READY
 
-        self.ui_manager.update_for_mode(AppMode.READY)
+            self.ui_manager.update_for_mode(AppMode.READY)
         
         if self._saved_window_size is not None:
             QTimer.singleShot(10, self._restore_window_size)
@@ -606,6 +626,13 @@ class GifRecorderMainWindow(QMainWindow):
             )
 
     def _save_gif(self, frames: List[QImage], settings: QualitySettings) -> None:
+        try:
+            # Imported on first save - Pillow and NumPy are not needed for recording
+            from utils.gif_saver import save_gif_from_frames
+        except ImportError as e:
+            QMessageBox.critical(self, "Missing Dependency", f"Cannot save GIF:\n\n{e}")
+            return
+        
         fps = self.preview_widget.preview_fps_spin.value()
         
         saved_filename = save_gif_from_frames(
@@ -696,25 +723,26 @@ class GifRecorderMainWindow(QMainWindow):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)  # Disable antialiasing for performance
 
         if self.recording_manager.mode == AppMode.EDITING:
-            painter.fillRect(self.rect(), CONTROLS_BACKGROUND_COLOR)
+            painter.fillRect(self.rect(), CONTROLS_BG_BRUSH)
         else:
             self._paint_recording_frame(painter)
 
     def _paint_recording_frame(self, painter: QPainter) -> None:
-        painter.fillRect(self.controls_frame.geometry(), CONTROLS_BACKGROUND_COLOR.lighter(120))
+        painter.fillRect(self.controls_frame.geometry(), CONTROLS_BG_LIGHT_BRUSH)
 
         recording_area_height = self.height() - self.controls_frame.height()
 
-        painter.fillRect(0, 0, self.width(), FRAME_THICKNESS, FRAME_COLOR)
+        painter.fillRect(0, 0, self.width(), FRAME_THICKNESS, FRAME_BRUSH)
         painter.fillRect(0, recording_area_height - FRAME_THICKNESS,
-                        self.width(), FRAME_THICKNESS, FRAME_COLOR)
+                        self.width(), FRAME_THICKNESS, FRAME_BRUSH)
         painter.fillRect(0, FRAME_THICKNESS, FRAME_THICKNESS,
-                        recording_area_height - (2 * FRAME_THICKNESS), FRAME_COLOR)
+                        recording_area_height - (2 * FRAME_THICKNESS), FRAME_BRUSH)
         painter.fillRect(self.width() - FRAME_THICKNESS, FRAME_THICKNESS,
-                        FRAME_THICKNESS, recording_area_height - (2 * FRAME_THICKNESS), FRAME_COLOR)
+                        FRAME_THICKNESS, recording_area_height - (2 * FRAME_THICKNESS), FRAME_BRUSH)
     
     def resizeEvent(self, event: QResizeEvent) -> None:
         super().resizeEvent(event)
+        self.ui_manager.invalidate_mask()
         
         # Debounce resize updates to reduce lag during scaling
         self._resize_timer.stop()
@@ -731,7 +759,7 @@ class GifRecorderMainWindow(QMainWindow):
 
     ### marker1
     def mousePressEvent(self, event: QMouseEvent) -> None:
-        if self.recording_manager.mode in [AppMode.RECORDING]:
+        if self.recording_manager.mode & AppMode.RECORDING:
             event.ignore()
             return
 
@@ -747,7 +775,7 @@ class GifRecorderMainWindow(QMainWindow):
         super().moveEvent(event)
 
         # Update recording rectangle when window is moved during recording
-        if self.recording_manager.mode in [AppMode.RECORDING, AppMode.PAUSED]:
+        if self.recording_manager.mode & RECORDING_MODES:
             if self.recording_manager.timer:
                 new_rect = self.get_recording_rect()
                 self.recording_manager.timer.update_recording_rect(new_rect)
@@ -756,7 +784,7 @@ class GifRecorderMainWindow(QMainWindow):
 
     ### marker1
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
-        if self.recording_manager.mode in [AppMode.RECORDING]:
+        if self.recording_manager.mode & AppMode.RECORDING:
             event.ignore()
             return
 
@@ -804,6 +832,10 @@ class GifRecorderMainWindow(QMainWindow):
         if hasattr(self, '_resize_timer'):
             self._resize_timer.stop()
 
+        # Drain background preview scaling before its signal object goes away
+        if hasattr(self, 'preview_widget'):
+            self.preview_widget.shutdown()
+
         # Stop any running post-commands
         if hasattr(self, 'cmd_executor'):
             self.cmd_executor.stop_all(force=True)
@@ -1,8 +1,7 @@
+from contextlib import ExitStack
 from typing import Optional
 
-from PyQt6.QtCore import QSettings
-
-from utils.qt_imports import *
+from utils.qt_imports import QMainWindow, QSettings, QSignalBlocker
 from core.data_classes import HotkeyConfig
 
 
@@ -213,24 +212,40 @@ class ConfigManager:
         Args:
             window: GifRecorderMainWindow instance
         """
-        # Load recording settings
         fps, mouse_skips = self.load_recording_settings()
-        window.fps_spin.setValue(fps)
-        window.mouse_skips_spin.setValue(mouse_skips)
-
-        # Load quality settings
         quality = self.load_quality_settings()
-        window.scale_combo.setCurrentIndex(quality["scale_index"])
-        window.colors_combo.setCurrentIndex(quality["colors_index"])
-        window.skip_frame_spin.setValue(quality["skip_frame"])
-        window.similarity_check.setChecked(quality["similarity_enabled"])
-        window.similarity_slider.setValue(quality["similarity_value"])
-        window.dithering_check.setChecked(quality["dithering_enabled"])
-        window.disposal_combo.setCurrentIndex(quality["disposal_index"])
-        window.lossy_level_slider.setValue(quality["lossy_level"])
-
-        # Load post command
-        window.post_command_text_edit.setPlainText(self.load_post_command())
+
+        targets = [
+            window.fps_spin, window.mouse_skips_spin,
+            window.scale_combo, window.colors_combo, window.skip_frame_spin,
+            window.similarity_check, window.similarity_slider,
+            window.dithering_check, window.disposal_combo,
+            window.lossy_level_slider, window.post_command_text_edit
+        ]
+
+        # Block change signals while restoring, dependent widgets are synced once afterwards
+        with ExitStack() as stack:
+            for widget in targets:
+                stack.enter_context(QSignalBlocker(widget))
+
+            # Load recording settings
+            window.fps_spin.setValue(fps)
+            window.mouse_skips_spin.setValue(mouse_skips)
+
+            # Load quality settings
+            window.scale_combo.setCurrentIndex(quality["scale_index"])
+            window.colors_combo.setCurrentIndex(quality["colors_index"])
+            window.skip_frame_spin.setValue(quality["skip_frame"])
+            window.similarity_check.setChecked(quality["similarity_enabled"])
+            window.similarity_slider.setValue(quality["similarity_value"])
+            window.dithering_check.setChecked(quality["dithering_enabled"])
+            window.disposal_combo.setCurrentIndex(quality["disposal_index"])
+            window.lossy_level_slider.setValue(quality["lossy_level"])
+
+            # Load post command
+            window.post_command_text_edit.setPlainText(self.load_post_command())
+
+        window.settings_loaded.emit()
 
         # Note: Window state is usually loaded before show(), so handle separately
 
@@ -6,6 +6,25 @@ if TYPE_CHECKING:
     from widgets.main_window import GifRecorderMainWindow
 
 
+def validate_hotkey_config(config: HotkeyConfig) -> Optional[str]:
+    """Check every hotkey string against pynput's parser.
+
+    Returns:
+        Error message for the first invalid hotkey, or None if all are valid
+    """
+    hotkeys = {
+        "record": config.record,
+        "pause": config.pause,
+        "stop": config.stop,
+        "record_frame": config.record_frame,
+    }
+    for name, hotkey in hotkeys.items():
+        try:
+            keyboard.HotKey.parse(hotkey)
+        except ValueError as e:
+            return f"Invalid {name} hotkey '{hotkey}': {e}"
+    return None
+
 
 class HotkeyManager:
     """Manages global hotkeys with proper error handling."""
@@ -15,27 +34,46 @@ class HotkeyManager:
         self.config = config
         self.listener: Optional[keyboard.GlobalHotKeys] = None
         self._is_active = False
+        self._status_text_cache = ""
+        self._refresh_status_text()
+
+    def set_config(self, config: HotkeyConfig) -> None:
+        """Replace the hotkey configuration. Call setup() afterwards to apply it."""
+        self.config = config
+        self._refresh_status_text()
     
     def setup(self) -> bool:
         """Setup global hotkeys. Returns True if successful."""
+        # Reject malformed hotkey strings before a listener thread is spun up
+        error = validate_hotkey_config(self.config)
+        if error:
+            print(f"Failed to setup global hotkeys: {error}")
+            self.listener = None
+            self._is_active = False
+            self._refresh_status_text()
+            return False
+
+        hotkey_map = {
+            self.config.record: self._safe_emit_record,
+            self.config.pause: self._safe_emit_pause,
+            self.config.stop: self._safe_emit_stop,
+            self.config.record_frame: self._safe_emit_record_frame  # NEW
+        }
+
         try:
-            hotkey_map = {
-                self.config.record: self._safe_emit_record,
-                self.config.pause: self._safe_emit_pause,
-                self.config.stop: self._safe_emit_stop,
-                self.config.record_frame: self._safe_emit_record_frame  # NEW
-            }
-            
             self.listener = keyboard.GlobalHotKeys(hotkey_map)
             self.listener.start()
             self._is_active = True
             return True
-            
-        except Exception as e:
+
+        except (OSError, RuntimeError) as e:
             print(f"Failed to setup global hotkeys: {e}")
             self.listener = None
             self._is_active = False
             return False
+
+        finally:
+            self._refresh_status_text()
     
     def cleanup(self) -> None:
         """Clean up hotkey listener."""
@@ -46,6 +84,7 @@ class HotkeyManager:
                 self._is_active = False
             except Exception as e:
                 print(f"Error stopping hotkey listener: {e}")
+        self._refresh_status_text()
     
     def _safe_emit_record(self) -> None:
         if not self.main_window._is_closing:
@@ -63,10 +102,16 @@ class HotkeyManager:
         if not self.main_window._is_closing:
             self.main_window.record_frame_signal.emit()
     
+    def _refresh_status_text(self) -> None:
+        """Rebuild the cached status text after config or listener state changes."""
+        if self._is_active:
+            self._status_text_cache = (
+                f"Hotkeys: {self.config.record} (Record), {self.config.pause} (Pause), "
+                f"{self.config.stop} (Stop), {self.config.record_frame} (Record 1 Frame)")
+        else:
+            self._status_text_cache = "Hotkeys disabled (setup failed)"
+
     @property
     def status_text(self) -> str:
         """Get status text for hotkeys."""
-        if self._is_active:
-            return (f"Hotkeys: {self.config.record} (Record), {self.config.pause} (Pause), "
-                   f"{self.config.stop} (Stop), {self.config.record_frame} (Record 1 Frame)")
-        return "Hotkeys disabled (setup failed)"
+        return self._status_text_cache
@@ -1,5 +1,5 @@
 from typing import Optional, TYPE_CHECKING
-from utils.qt_imports import *
+from utils.qt_imports import QMessageBox, QRect
 from core.app_enums import AppMode
 from core.recording_timer import RecordingTimer
 
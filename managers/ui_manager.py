@@ -1,163 +1,323 @@
-from typing import TYPE_CHECKING
-from core.app_enums import AppMode
-from utils.qt_imports import *
+from contextlib import contextmanager
+from typing import Optional, TYPE_CHECKING
+from core.app_enums import AppMode, RECORDING_MODES
+from utils.qt_imports import Qt, QTimer, QSize, QSignalBlocker, QObject, QEvent, QToolTip
 
 if TYPE_CHECKING:
     from widgets.main_window import GifRecorderMainWindow
 
+# --- Button tooltips ---
+TT_RECORD_READY = "Start continuous recording"
+TT_RECORD_RECORDING = "Recording in progress - use Stop to finish"
+TT_RECORD_PAUSED = "Recording paused - resume or stop first"
+TT_RECORD_EDITING = "Start new recording (will ask to discard current frames)"
+TT_RECORD_FRAME = "Tries to resume/pause this will often result in 1 frame record (Experimental)"
+TT_RECORD_FRAME_EDITING = "Start new frame-by-frame recording"
+TT_PAUSE_RESUME = "Resume recording"
+TT_NO_RECORDING = "No recording active"
+TT_STOP = "Stop recording and switch to edit mode"
+TT_STOP_FIRST = "Stop recording first"
+TT_SAVE_NO_FRAMES = "No frames to save"
+TT_SAVE_FRAMES = "Save {} frames as GIF"
+TT_NEW_CLEAR = "Clear frames and start new session"
+TT_NEW_NO_FRAMES = "No frames to clear"
+TT_NEW_EDITING = "Discard current frames and start new session"
+
 
 class UIManager:
     """Manages UI state transitions and updates."""
 
+    # Per-mode rows in the order (record, record_frame, pause, stop, save, new).
+    # None leaves the widget untouched, callables receive the UIManager.
+    _BTN_STATES = {
+        AppMode.READY: (True, True, False, False, False, lambda ui: bool(ui.main_window.frames)),
+        AppMode.RECORDING: (False, None, True, True, False, False),
+        AppMode.PAUSED: (False, True, True, True, False, False),
+        AppMode.EDITING: (True, True, False, False, True, True),
+    }
+
+    _TOOLTIPS = {
+        AppMode.READY: (
+            TT_RECORD_READY,
+            TT_RECORD_FRAME,
+            TT_NO_RECORDING,
+            TT_NO_RECORDING,
+            TT_SAVE_NO_FRAMES,
+            lambda ui: TT_NEW_CLEAR if ui.main_window.frames else TT_NEW_NO_FRAMES,
+        ),
+        AppMode.RECORDING: (
+            TT_RECORD_RECORDING,
+            None,
+            None,
+            TT_STOP,
+            TT_STOP_FIRST,
+            TT_STOP_FIRST,
+        ),
+        AppMode.PAUSED: (
+            TT_RECORD_PAUSED,
+            TT_RECORD_FRAME,
+            TT_PAUSE_RESUME,
+            TT_STOP,
+            TT_STOP_FIRST,
+            TT_STOP_FIRST,
+        ),
+        AppMode.EDITING: (
+            TT_RECORD_EDITING,
+            TT_RECORD_FRAME_EDITING,
+            TT_NO_RECORDING,
+            TT_NO_RECORDING,
+            lambda ui: ui._save_tooltip(),
+            TT_NEW_EDITING,
+        ),
+    }
+
+    # (sizegrip enabled, sizegrip visible, mouse skips visible)
+    _EXTRA_STATES = {
+        AppMode.READY: (True, True, True),
+        AppMode.RECORDING: (False, True, False),
+        AppMode.PAUSED: (False, True, False),
+        AppMode.EDITING: (True, False, False),
+    }
+
+    # Window resize policy per (previous mode, new mode), None is the first update.
+    # Transitions that are not listed keep the current window size.
+    _RESIZE_TRANSITIONS = {
+        (None, AppMode.READY): "adjust",
+        (AppMode.READY, AppMode.EDITING): "adjust",
+        (AppMode.RECORDING, AppMode.EDITING): "adjust",
+        (AppMode.PAUSED, AppMode.EDITING): "adjust",
+        # The saved size (and position) is restored by MainWindow.clear_frames
+        (AppMode.EDITING, AppMode.READY): "adjust_if_unsaved",
+    }
+
     def __init__(self, main_window):
         self.main_window = main_window
 
-    def update_for_mode(self, mode: AppMode) -> None:
-        """Update UI elements based on current application mode."""
-        is_edit = mode == AppMode.EDITING
-        is_recording = mode in [AppMode.RECORDING, AppMode.PAUSED]
-
-        self._update_button_states(mode)
-        self._update_button_text(mode)
-        self._update_tooltips(mode)
-        self._update_visibility(is_edit, is_recording)
-        self._update_window_properties(is_edit)
-        self._update_layout(is_edit)
+        # Last values pushed to the buttons, setters are skipped when unchanged
+        self._last_enabled = (None,) * 6
+        # Tooltip table entries for the current mode, resolved when a button is hovered
+        self._current_tooltips = (None,) * 6
+        self._tooltip_filter: Optional[_TooltipFilter] = None
+        self._last_mode: Optional[AppMode] = None
+
+        # Save tooltip is only reformatted when the frame count changes
+        self._last_frame_count_for_tt = -1
+        self._save_tooltip_text = ""
+
+        # The main window creates its layout with the recording area spacer in place
+        self._spacer_inserted = True
+
+        # Window size adjustSize() produced for edit mode, reused afterwards
+        self._editing_size: Optional[QSize] = None
+
+        # Cleared on resize and whenever edit mode drops the mask
+        self._mask_valid = False
+
+        # Deferred mode updates, flushed once per event loop iteration
+        self._pending_mode: Optional[AppMode] = None
+        self._pending_force = False
+        self._flush_scheduled = False
+        self._batch_depth = 0
+        self._dirty = False
+
+        self._mode_buttons: Optional[tuple] = None
+        self._recording_widgets: Optional[tuple] = None
+        self._edit_widgets: Optional[tuple] = None
+        self._fps_widgets: Optional[tuple] = None
+
+    def update_for_mode(self, mode: AppMode, force: bool = False) -> None:
+        """Schedule a UI update for the given mode.
+
+        Requests made within one event loop iteration are coalesced, only the
+        last requested mode is applied.
+
+        Outside of batch() the update is deferred to the next event loop iteration,
+        so the widgets still show the old mode when this returns. Inside batch() it
+        is applied synchronously when the outermost block exits; use that where the
+        new state must be in place immediately (e.g. before the first paint).
+        """
+        self._pending_mode = mode
+        self._pending_force = self._pending_force or force
+
+        if self._batch_depth > 0:
+            # Applied once when the outermost batch() exits
+            self._dirty = True
+            return
+
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush)
+
+    @contextmanager
+    def batch(self):
+        """Collapse all mode updates requested inside the block into one update.
+
+        Nested blocks are allowed, the update runs when the outermost one exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._dirty = False
+                mode, force = self._pending_mode, self._pending_force
+                self._pending_mode = None
+                self._pending_force = False
+                self._apply_mode(mode, force)
+
+    def _flush(self) -> None:
+        """Apply the last mode requested since the flush was scheduled."""
+        mode, force = self._pending_mode, self._pending_force
+        self._pending_mode = None
+        self._pending_force = False
+        self._flush_scheduled = False
+
+        if mode is not None:
+            self._apply_mode(mode, force)
+
+    def _apply_mode(self, mode: AppMode, force: bool = False) -> None:
+        """Update UI elements based on current application mode.
+
+        Calls with the mode that is already applied are ignored unless force is set;
+        frame count changes go through refresh_status() instead.
+
+        Repaints are suspended while the widgets are mutated so Qt coalesces them
+        into a single repaint. Nothing in here may call processEvents().
+        """
+        if mode is self._last_mode and not force:
+            return
 
-        self.main_window.update_status_label()
-        self.main_window.update()
+        mw = self.main_window
+        is_edit = bool(mode & AppMode.EDITING)
+        is_recording = bool(mode & RECORDING_MODES)
+
+        # No slot needs to observe the intermediate states of a transition
+        blockers = [QSignalBlocker(widget)
+                    for widget in self._buttons() + (mw.fps_spin,)]
+
+        mw.setUpdatesEnabled(False)
+        try:
+            self._update_button_states(mw, mode)
+            self._update_button_text(mw, mode)
+            self._update_tooltips(mode)
+            self._update_visibility(mw, is_edit, is_recording)
+            self._update_window_properties(mw, is_edit)
+            self._update_layout(mw, is_edit)
+
+            mw.update_status_label()
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+            # Re-enabling updates schedules one repaint for the whole window
+            mw.setUpdatesEnabled(True)
 
         # Auto-resize only on specific transitions
-        if is_edit != self.main_window._last_mode_was_edit:
-            if (self.main_window._saved_window_size is None or
-                    (is_edit and not self.main_window._last_mode_was_edit)):
-                self.main_window.adjustSize()
-
-        self.main_window._last_mode_was_edit = is_edit
+        action = self._RESIZE_TRANSITIONS.get((self._last_mode, mode))
+        if action == "adjust" and is_edit:
+            # Edit mode always shows the same widgets, so its size hint only needs
+            # the widget tree walk of adjustSize() once
+            if self._editing_size is None:
+                mw.adjustSize()
+                self._editing_size = mw.size()
+            else:
+                mw.resize(self._editing_size)
+        elif action == "adjust":
+            mw.adjustSize()
+        elif action == "adjust_if_unsaved" and mw._saved_window_size is None:
+            mw.adjustSize()
+
+        if self._last_mode is AppMode.EDITING and not is_edit:
+            # The session's frames are gone, don't keep its save tooltip around
+            self._last_frame_count_for_tt = -1
+            self._save_tooltip_text = ""
+
+        self._last_mode = mode
+
+    def refresh_status(self) -> None:
+        """Refresh the parts of the UI that depend on the frame count, not the mode."""
+        self.main_window.update_status_label()
 
-    def _update_button_states(self, mode: AppMode) -> None:
+    def _buttons(self) -> tuple:
+        """Mode-driven buttons in the column order used by the state tables."""
+        if self._mode_buttons is None:
+            mw = self.main_window
+            self._mode_buttons = (mw.record_btn, mw.record_frame_btn, mw.pause_btn,
+                                  mw.stop_btn, mw.save_btn, mw.new_btn)
+        return self._mode_buttons
+
+    def _resolve(self, entries: tuple, last: tuple) -> tuple:
+        """Resolve a table row: callables are evaluated, None keeps the last value."""
+        return tuple(
+            last[i] if entry is None else (entry(self) if callable(entry) else entry)
+            for i, entry in enumerate(entries)
+        )
+
+    def _save_tooltip(self) -> str:
+        """Save button tooltip for edit mode, formatted once per frame count."""
+        frame_count = len(self.main_window.frames)
+        if frame_count != self._last_frame_count_for_tt:
+            self._save_tooltip_text = TT_SAVE_FRAMES.format(frame_count)
+            self._last_frame_count_for_tt = frame_count
+        return self._save_tooltip_text
+
+    def _update_button_states(self, mw, mode: AppMode) -> None:
         """Update button states based on mode - buttons keep their names!"""
-        mw = self.main_window
-
-        if mode == AppMode.READY:
-            # Ready for a new recording
-            mw.record_btn.setEnabled(True)
-            mw.record_frame_btn.setEnabled(True)
-            mw.pause_btn.setEnabled(False)
-            mw.stop_btn.setEnabled(False)
-            mw.save_btn.setEnabled(False)
-            mw.new_btn.setEnabled(bool(mw.frames))  # Only if frames are present
-            mw.sizegrip.setEnabled(True)
-            mw.sizegrip.setVisible(True)
-            mw.mouse_skips_spin.setVisible(True)
-            mw.mouse_skips_label.setVisible(True)
-
-        elif mode == AppMode.RECORDING:
-            # Recording is in progress
-            mw.record_btn.setEnabled(False)  # No new recording during an ongoing one
-            mw.pause_btn.setEnabled(True)
-            mw.stop_btn.setEnabled(True)
-            mw.save_btn.setEnabled(False)
-            mw.new_btn.setEnabled(False)
-            mw.sizegrip.setEnabled(False)
-            mw.sizegrip.setVisible(True)
-            mw.mouse_skips_spin.setVisible(False)
-            mw.mouse_skips_label.setVisible(False)
-
-
-        elif mode == AppMode.PAUSED:
-            # Recording is paused
-            mw.record_btn.setEnabled(False)
-            mw.record_frame_btn.setEnabled(True)  # Add single frames
-            mw.pause_btn.setEnabled(True)  # Resume is possible
-            mw.stop_btn.setEnabled(True)
-            mw.save_btn.setEnabled(False)
-            mw.new_btn.setEnabled(False)
-            mw.sizegrip.setEnabled(False)
-            mw.sizegrip.setVisible(True)
-            mw.mouse_skips_spin.setVisible(False)
-            mw.mouse_skips_label.setVisible(False)
-
-        elif mode == AppMode.EDITING:
-            # Frames are available, ready for editing/saving
-            mw.record_btn.setEnabled(True)  # New recording is possible
-            mw.record_frame_btn.setEnabled(True)
-            mw.pause_btn.setEnabled(False)
-            mw.stop_btn.setEnabled(False)
-            mw.save_btn.setEnabled(True)  # Saving is possible
-            mw.new_btn.setEnabled(True)  # Resetting the session is possible
-            mw.sizegrip.setEnabled(True)
-            mw.sizegrip.setVisible(False)
-            mw.mouse_skips_spin.setVisible(False)
-            mw.mouse_skips_label.setVisible(False)
+        new = self._resolve(self._BTN_STATES[mode], self._last_enabled)
+        for i, button in enumerate(self._buttons()):
+            if new[i] != self._last_enabled[i]:
+                button.setEnabled(new[i])
+        self._last_enabled = new
+
+        sizegrip_enabled, sizegrip_visible, mouse_skips_visible = self._EXTRA_STATES[mode]
+        mw.sizegrip.setEnabled(sizegrip_enabled)
+        mw.sizegrip.setVisible(sizegrip_visible)
+        mw.mouse_skips_spin.setVisible(mouse_skips_visible)
+        mw.mouse_skips_label.setVisible(mouse_skips_visible)
 
     def _update_tooltips(self, mode: AppMode) -> None:
-        """Update button tooltips based on current mode."""
-        mw = self.main_window
-
-        if mode == AppMode.READY:
-            mw.record_btn.setToolTip("Start continuous recording")
-            mw.record_frame_btn.setToolTip(
-                "Tries to resume/pause this will often result in 1 frame record (Experimental)")
-            mw.pause_btn.setToolTip("No recording active")
-            mw.stop_btn.setToolTip("No recording active")
-            mw.save_btn.setToolTip("No frames to save")
-            mw.new_btn.setToolTip("Clear frames and start new session" if mw.frames else "No frames to clear")
-
-        elif mode == AppMode.RECORDING:
-            mw.record_btn.setToolTip("Recording in progress - use Stop to finish")
-
-            mw.stop_btn.setToolTip("Stop recording and switch to edit mode")
-            mw.save_btn.setToolTip("Stop recording first")
-            mw.new_btn.setToolTip("Stop recording first")
-
-        elif mode == AppMode.PAUSED:
-            mw.record_btn.setToolTip("Recording paused - resume or stop first")
-            mw.record_frame_btn.setToolTip(
-                "Tries to resume/pause this will often result in 1 frame record (Experimental)")
-            mw.pause_btn.setToolTip("Resume recording")
-            mw.stop_btn.setToolTip("Stop recording and switch to edit mode")
-            mw.save_btn.setToolTip("Stop recording first")
-            mw.new_btn.setToolTip("Stop recording first")
-
-
-        elif mode == AppMode.EDITING:
-            frame_count = len(mw.frames)
-            mw.record_btn.setToolTip("Start new recording (will ask to discard current frames)")
-            mw.record_frame_btn.setToolTip("Start new frame-by-frame recording")
-            mw.pause_btn.setToolTip("No recording active")
-            mw.stop_btn.setToolTip("No recording active")
-            mw.save_btn.setToolTip(f"Save {frame_count} frames as GIF")
-            mw.new_btn.setToolTip("Discard current frames and start new session")
-
-    def _update_visibility(self, is_edit: bool, is_recording: bool) -> None:
+        """Select the tooltip row for the current mode.
+
+        Nothing is pushed to the buttons here, _TooltipFilter asks for the text
+        only when a button is actually hovered.
+        """
+        if self._tooltip_filter is None:
+            self._tooltip_filter = _TooltipFilter(self)
+            for button in self._buttons():
+                button.installEventFilter(self._tooltip_filter)
+
+        self._current_tooltips = tuple(
+            last if entry is None else entry
+            for entry, last in zip(self._TOOLTIPS[mode], self._current_tooltips)
+        )
+
+    def _tooltip_for(self, button) -> Optional[str]:
+        """Tooltip text for one of the mode-driven buttons in the current mode."""
+        entry = self._current_tooltips[self._buttons().index(button)]
+        return entry(self) if callable(entry) else entry
+
+    def _update_visibility(self, mw, is_edit: bool, is_recording: bool) -> None:
         """Update widget visibility based on mode."""
-        mw = self.main_window
-
-        # Show tab widget only in edit mode
-        mw.edit_tabs.setVisible(is_edit)
+        # Widget groups are captured on first use, the main window builds its UI after us
+        if self._recording_widgets is None:
+            self._recording_widgets = (mw.record_frame_btn, mw.pause_btn, mw.config_btn)
+            self._edit_widgets = (mw.save_btn, mw.new_btn, mw.edit_tabs)
+            self._fps_widgets = (mw.fps_label, mw.fps_spin, mw.status_label)
 
         # Stop button: visible only during recording (RECORDING or PAUSED mode)
-        mw.stop_btn.setVisible(is_recording)
+        self._set_visible(mw, (mw.stop_btn,), is_recording)
 
         # Record button: visible when NOT recording (inverse of stop button)
-        mw.record_btn.setVisible(not is_recording and not is_edit)
+        self._set_visible(mw, (mw.record_btn,), not is_recording and not is_edit)
 
         # Show recording buttons in all modes except edit mode
-        recording_buttons_visible = not is_edit
-        mw.record_frame_btn.setVisible(recording_buttons_visible)
-        mw.pause_btn.setVisible(recording_buttons_visible)
-        mw.config_btn.setVisible(recording_buttons_visible)  # CHANGED: shortcuts_btn -> config_btn
+        self._set_visible(mw, self._recording_widgets, not is_edit)
 
-        # Session buttons (Save/New) only visible in edit mode
-        mw.save_btn.setVisible(is_edit)
-        mw.new_btn.setVisible(is_edit)
+        # Tab widget and session buttons (Save/New) only visible in edit mode
+        self._set_visible(mw, self._edit_widgets, is_edit)
 
         # FPS and Status Label only visible in recording mode (when green frame is visible)
-        fps_status_visible = not is_edit
-        mw.fps_label.setVisible(fps_status_visible)
-        mw.fps_spin.setVisible(fps_status_visible)
-        mw.status_label.setVisible(fps_status_visible)
+        self._set_visible(mw, self._fps_widgets, not is_edit)
 
         # FPS setting can only be changed when not recording
         mw.fps_spin.setEnabled(not is_recording)
@@ -165,31 +325,43 @@ class UIManager:
         # Quit button is always available
         mw.quit_btn.setEnabled(True)
 
-    def _update_window_properties(self, is_edit: bool) -> None:
+    def _set_visible(self, mw, widgets: tuple, visible: bool) -> None:
+        """Apply visibility to a widget group, skipping widgets already in that state."""
+        for widget in widgets:
+            if widget.isVisibleTo(mw) != visible:
+                widget.setVisible(visible)
+
+    def _update_window_properties(self, mw, is_edit: bool) -> None:
         """Update window transparency and mask."""
-        mw = self.main_window
+
+        translucent = not is_edit
+        if mw.testAttribute(Qt.WidgetAttribute.WA_TranslucentBackground) != translucent:
+            mw.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, translucent)
 
         if is_edit:
-            mw.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, False)
             mw.clearMask()
-        else:
-            mw.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
+            self._mask_valid = False
+        elif not self._mask_valid:
             mw.update_mask()
+            self._mask_valid = True
+
+    def invalidate_mask(self) -> None:
+        """Force the next non-edit mode update to rebuild the window mask."""
+        self._mask_valid = False
 
-    def _update_layout(self, is_edit: bool) -> None:
+    def _update_layout(self, mw, is_edit: bool) -> None:
         """Update layout spacer for recording area."""
-        mw = self.main_window
 
         if is_edit:
-            if mw.main_layout.indexOf(mw.recording_area_spacer) != -1:
+            if self._spacer_inserted:
                 mw.main_layout.removeItem(mw.recording_area_spacer)
+                self._spacer_inserted = False
         else:
-            if mw.main_layout.indexOf(mw.recording_area_spacer) == -1:
+            if not self._spacer_inserted:
                 mw.main_layout.insertSpacerItem(0, mw.recording_area_spacer)
+                self._spacer_inserted = True
 
-    def _update_button_text(self, mode: AppMode):
-        mw = self.main_window
-
+    def _update_button_text(self, mw, mode: AppMode):
         if mode == AppMode.READY:
             mw.pause_btn.setText("▮▮")
         elif mode == AppMode.RECORDING:
@@ -197,4 +369,23 @@ class UIManager:
         elif mode == AppMode.PAUSED:
             mw.pause_btn.setText("▶")
         elif mode == AppMode.EDITING:
-            mw.pause_btn.setText("▮▮")
\ No newline at end of file
+            mw.pause_btn.setText("▮▮")
+
+
+class _TooltipFilter(QObject):
+    """Shows mode-dependent button tooltips on demand instead of storing them."""
+
+    def __init__(self, ui_manager: UIManager):
+        super().__init__(ui_manager.main_window)
+        self.ui_manager = ui_manager
+
+    def eventFilter(self, obj, event) -> bool:
+        if event.type() == QEvent.Type.ToolTip:
+            text = self.ui_manager._tooltip_for(obj)
+            if text:
+                QToolTip.showText(event.globalPos(), text, obj)
+            else:
+                QToolTip.hideText()
+                event.ignore()
+            return True
+        return super().eventFilter(obj, event)
@@ -1,12 +1,17 @@
 # utils/constants.py
 
-from .qt_imports import QColor
+from .qt_imports import QColor, QBrush
 
 # --- Display Constants ---
 FRAME_THICKNESS = 4
 FRAME_COLOR = QColor(0, 255, 0, 200)
 CONTROLS_BACKGROUND_COLOR = QColor(40, 42, 54, 255)
 
+# Built once at import so paint paths don't allocate them per paint
+FRAME_BRUSH = QBrush(FRAME_COLOR)
+CONTROLS_BG_BRUSH = QBrush(CONTROLS_BACKGROUND_COLOR)
+CONTROLS_BG_LIGHT_BRUSH = QBrush(CONTROLS_BACKGROUND_COLOR.lighter(120))
+
 # --- Window and UI Constants ---
 INITIAL_WINDOW_WIDTH = 500
 INITIAL_WINDOW_HEIGHT = 720
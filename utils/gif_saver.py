@@ -3,40 +3,66 @@ Clean GIF saver module with proper error handling and separation of concerns.
 Fixed: Single continuous progress dialog without interruption.
 """
 
-import sys
-import hashlib
+import os
+import shutil
+import subprocess
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Callable, Optional, Tuple
-from dataclasses import dataclass
+from typing import List, Callable, Iterable, Iterator, Optional, Tuple
+from dataclasses import dataclass, field
 from contextlib import contextmanager
 
-from .qt_imports import QImage, QFileDialog, QMessageBox, QProgressDialog, Qt, QT_VERSION, QApplication
+import numpy as np
+
+from .qt_imports import (
+    QImage, QFileDialog, QMessageBox, QProgressDialog, Qt, QT_VERSION, QApplication,
+    QThread, QEventLoop, pyqtSignal
+)
 
 try:
-    from PIL import Image, ImageChops, ImageStat
-except ImportError:
-    print("Error: Pillow must be installed!")
-    print("Installation: pip install pillow")
-    sys.exit(1)
+    from PIL import Image, ImageChops, GifImagePlugin
+except ImportError as e:
+    # Imported lazily on first save; the caller reports this instead of the app exiting
+    raise ImportError("Pillow must be installed! Installation: pip install pillow") from e
 
 
-@dataclass
+@dataclass(frozen=True)
 class GifSettings:
-    """Configuration for GIF creation."""
+    """Configuration for GIF creation. Immutable; derived values are computed once."""
     fps: int
     scale_factor: float
     num_colors: int
     use_dithering: bool
-    skip_value: int
+    skip_value: int  # Step the caller used to pick frames; frames are not skipped again here
     lossy_level: int = 0  # 0-10 scale for quality reduction
     disposal_method: int = 0  # 0-3 for GIF disposal methods
     similarity_threshold: float = 0.95  # NEU: Schwellenwert für Ähnlichkeit (0-1)
     enable_similarity_skip: bool = True  # NEU: Frame-Ähnlichkeitsprüfung aktivieren
+    use_global_palette: bool = True  # One palette for the whole GIF, built from sampled frames
+    use_gifsicle: bool = True  # Optimize the written GIF with gifsicle if it is installed
+    
+    # Derived values, filled in by __post_init__ (read in the per-frame loop)
+    _effective_num_colors: int = field(init=False, repr=False, compare=False)
+    _frame_duration_ms: int = field(init=False, repr=False, compare=False)
+    _pil_dither: int = field(init=False, repr=False, compare=False)
+    _pil_resample: int = field(init=False, repr=False, compare=False)
+    _reduce_factor: int = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        """Validate settings after initialization."""
+        """Validate settings and precompute derived values after initialization."""
         self._validate()
+        object.__setattr__(self, '_effective_num_colors', self._compute_effective_num_colors())
+        object.__setattr__(self, '_frame_duration_ms', int(1000 / self.fps) * self.skip_value)
+        if hasattr(Image, 'Dither'):
+            dither = Image.Dither.FLOYDSTEINBERG if self.use_dithering else Image.Dither.NONE
+        else:
+            dither = 1 if self.use_dithering else 0
+        object.__setattr__(self, '_pil_dither', dither)
+        object.__setattr__(self, '_pil_resample', self._pick_resample())
+        object.__setattr__(self, '_reduce_factor', self._pick_reduce_factor())
     
     def _validate(self) -> None:
         """Validate all settings are within acceptable ranges."""
@@ -55,8 +81,21 @@ class GifSettings:
         if not 0 <= self.similarity_threshold <= 1.0:  # NEU
             raise ValueError("Similarity threshold must be between 0 and 1")
     
-    @property
-    def effective_num_colors(self) -> int:
+    def _pick_resample(self) -> int:
+        """Choose the cheapest filter that is indistinguishable after quantization."""
+        resampling = Image.Resampling if hasattr(Image, 'Resampling') else Image
+        if self.scale_factor >= 0.5:
+            return resampling.BOX
+        return resampling.LANCZOS
+    
+    def _pick_reduce_factor(self) -> int:
+        """Return n when scale_factor is exactly 1/n (n > 1), else 0."""
+        if self.scale_factor >= 1.0:
+            return 0
+        factor = round(1 / self.scale_factor)
+        return factor if abs(factor * self.scale_factor - 1.0) < 1e-6 else 0
+    
+    def _compute_effective_num_colors(self) -> int:
         """Calculate effective color count after lossy compression."""
         if self.lossy_level == 0:
             return self.num_colors
@@ -65,96 +104,131 @@ class GifSettings:
         reduction_factor = 1 - (self.lossy_level / 10.0)
         return max(2, int(self.num_colors * reduction_factor))
     
+    @property
+    def effective_num_colors(self) -> int:
+        """Effective color count after lossy compression."""
+        return self._effective_num_colors
+    
     @property
     def frame_duration_ms(self) -> int:
-        """Calculate frame duration in milliseconds, accounting for skipped frames."""
-        base_duration = int(1000 / self.fps)
-        return base_duration * self.skip_value
-
-    # @property
-    # def pil_dither(self) -> Image.Dither:
-    #     """Get PIL dithering mode."""
-    #     return Image.Dither.FLOYDSTEINBERG if self.use_dithering else Image.Dither.NONE
+        """Frame duration in milliseconds, accounting for skipped frames."""
+        return self._frame_duration_ms
 
     @property
     def pil_dither(self):
-        """Get PIL dithering mode."""
-        if hasattr(Image, 'Dither'):
-            return Image.Dither.FLOYDSTEINBERG if self.use_dithering else Image.Dither.NONE
-        else:
-            return 1 if self.use_dithering else 0
+        """PIL dithering mode."""
+        return self._pil_dither
     
     @property
     def pil_resample(self) -> int:
-        """Get PIL resampling mode with version compatibility."""
-        if hasattr(Image, 'Resampling'):
-            return Image.Resampling.LANCZOS
-        return Image.LANCZOS
+        """PIL resampling mode for scaling: BOX for scale >= 0.5, LANCZOS below."""
+        return self._pil_resample
+    
+    @property
+    def reduce_factor(self) -> int:
+        """Integer downscale factor usable with Image.reduce(), or 0 if none applies."""
+        return self._reduce_factor
 
 class FrameSimilarityDetector:
     """Verbesserte Erkennung ähnlicher Frames mit mehreren Methoden."""
     
+    # Schnellprüfung über die MSE der 64x64-Graustufen: Frames, deren Ähnlichkeit
+    # um mehr als diese Marge unter dem Schwellenwert liegt, werden sofort behalten
+    FAST_KEEP_MARGIN = 0.1
+    # Frames, deren Abstand zu 1.0 unter diesem Anteil von (1 - Schwellenwert) liegt,
+    # werden ohne die vier Detailmetriken übersprungen
+    FAST_SKIP_FRACTION = 0.1
+    # Maximale Hamming-Distanz der 64-Bit-dHashes, bis zu der Frames als gleich gelten
+    # (schon 1-3 Bit verschlucken kleine Textänderungen, daher nur exakte Treffer)
+    HASH_MAX_DISTANCE = 0
+    # Blockgröße und mittlere Änderung, ab der ein Block als "geändert" gilt
+    BLOCK_SIZE = 8
+    BLOCK_CHANGE_THRESHOLD = 10
+    # Feste Größe, auf der Pixel-, Histogramm- und Blockmetriken unabhängig von der Framegröße laufen
+    SAMPLE_SIZE = (128, 128)
+    
     def __init__(self, threshold: float = 0.95):
         self.threshold = threshold
-        self.last_frame_hash: Optional[str] = None
-        self.last_processed_image: Optional[Image.Image] = None
-        self.last_histogram = None
-        self.last_structural_hash = None
+        self.last_frame_hash: Optional[int] = None
+        self.last_sample: Optional[np.ndarray] = None  # SAMPLE_SIZE-Version der Referenz
+        self.last_histogram: Optional[np.ndarray] = None
+        self.last_gray64: Optional[np.ndarray] = None
+        self.last_edges: Optional[np.ndarray] = None  # Mittelwertfreie Kantenkarte
+        self.last_edges_mean = 0.0
+        self.last_edges_norm = 0.0
+        self.last_structural_hash: Optional[bytes] = None
+        self.scene_changed = False  # Letzter Vergleich war eine große strukturelle Änderung
     
     def is_similar_to_previous(self, current_image: Image.Image) -> bool:
-        if self.last_processed_image is None:
-            self._update_reference(current_image)
+        self.scene_changed = False
+        # Graustufen-Version einmal erzeugen und für Hashes und Vorschaubild teilen
+        gray_image = current_image.convert('L')
+        if self.last_sample is None:
+            self._update_reference(current_image, gray_image)
             return False  # Erstes Frame immer behalten
         
-        # 1. Schnelle Hash-Prüfung zuerst (identische Frames)
-        current_hash = self._calculate_image_hash(current_image)
-        if current_hash == self.last_frame_hash:
-            return True  # Identische Frames überspringen
+        # 1. Schnelle Hash-Prüfung zuerst (gleiche Struktur). dHash sieht nur Helligkeits-
+        # unterschiede zwischen Nachbarpixeln, nicht gleichmäßige Helligkeits- oder Farb-
+        # änderungen (Fades, Blitze, Folienwechsel) - ein Treffer entscheidet daher nicht
+        # allein, sondern führt direkt zur MSE-Prüfung
+        current_hash = self._calculate_image_hash(gray_image)
+        hash_match = bin(current_hash ^ self.last_frame_hash).count('1') <= self.HASH_MAX_DISTANCE
         
         # 2. Struktureller Hash für große Änderungen
-        current_structural = self._calculate_structural_hash(current_image)
-        if current_structural != self.last_structural_hash:
+        if not hash_match and self._calculate_structural_hash(gray_image) != self.last_structural_hash:
             # Große strukturelle Änderung -> Frame behalten
-            self._update_reference(current_image)
+            self.scene_changed = True
+            self._update_reference(current_image, gray_image)
             return False
         
-        # 3. Detaillierte Ähnlichkeitsprüfung mit mehreren Methoden
-        similarity_scores = self._calculate_multiple_similarities(
-            self.last_processed_image, current_image
-        )
+        # 3. Schnelle MSE-Prüfung auf 64x64-Graustufen für eindeutige Fälle
+        current_gray = self._calculate_gray64(gray_image)
+        mse = np.mean((current_gray.astype(np.float32) - self.last_gray64) ** 2)
+        fast_similarity = 1.0 - np.sqrt(mse) / 255.0
+        if fast_similarity < self.threshold - self.FAST_KEEP_MARGIN:
+            # Deutlich unterschiedlich -> behalten
+            self._update_reference(current_image, gray_image)
+            return False
+        if 1.0 - fast_similarity < (1.0 - self.threshold) * self.FAST_SKIP_FRACTION:
+            # Praktisch unverändert -> überspringen
+            return True
+        
+        # 4. Detaillierte Ähnlichkeitsprüfung mit mehreren Methoden
+        sample_image = self._calculate_sample(current_image)
+        similarity_scores = self._calculate_multiple_similarities(sample_image, current_gray)
         
         # Gewichteter Durchschnitt der verschiedenen Ähnlichkeitsmetriken
         combined_similarity = self._combine_similarities(similarity_scores)
         
         if combined_similarity < self.threshold:
             # Frame ist unterschiedlich genug -> behalten
-            self._update_reference(current_image)
+            self._update_reference(current_image, gray_image)
             return False
         else:
             # Frame ist zu ähnlich -> überspringen
             return True
     
-    def _calculate_multiple_similarities(self, img1: Image.Image, img2: Image.Image) -> dict:
-        """Berechnet verschiedene Ähnlichkeitsmetriken."""
+    def _calculate_multiple_similarities(self, sample_image: Image.Image, gray: np.ndarray) -> dict:
+        """Berechnet verschiedene Ähnlichkeitsmetriken gegen das Referenz-Frame."""
         similarities = {}
         
         try:
-            # Bilder auf gleiche Größe bringen
-            if img1.size != img2.size:
-                resample = Image.Resampling.LANCZOS if hasattr(Image, 'Resampling') else Image.LANCZOS
-                img2 = img2.resize(img1.size, resample)
+            sample = np.asarray(sample_image)
+            
+            pixel_similarity = self._calculate_pixel_similarity(sample)
+            local_similarity = self._calculate_local_changes_similarity(sample)
             
             # 1. Pixel-basierte Ähnlichkeit (wie bisher)
-            similarities['pixel'] = self._calculate_pixel_similarity(img1, img2)
+            similarities['pixel'] = pixel_similarity
             
             # 2. Histogramm-Ähnlichkeit
-            similarities['histogram'] = self._calculate_histogram_similarity(img1, img2)
+            similarities['histogram'] = self._calculate_histogram_similarity(sample_image)
             
             # 3. Strukturelle Ähnlichkeit (vereinfacht)
-            similarities['structural'] = self._calculate_structural_similarity(img1, img2)
+            similarities['structural'] = self._calculate_structural_similarity(gray)
             
             # 4. Lokale Änderungen (für Textbearbeitung wichtig)
-            similarities['local_changes'] = self._calculate_local_changes_similarity(img1, img2)
+            similarities['local_changes'] = local_similarity
             
         except Exception as e:
             print(f"Fehler bei Ähnlichkeitsberechnung: {e}")
@@ -163,25 +237,22 @@ class FrameSimilarityDetector:
         
         return similarities
     
-    def _calculate_pixel_similarity(self, img1: Image.Image, img2: Image.Image) -> float:
-        """Ursprüngliche pixel-basierte Ähnlichkeit."""
-        diff = ImageChops.difference(img1, img2)
-        stat = ImageStat.Stat(diff)
-        avg_diff = sum(stat.mean) / len(stat.mean)
+    def _calculate_pixel_similarity(self, sample: np.ndarray) -> float:
+        """Pixel-basierte Ähnlichkeit über die mittlere absolute Differenz."""
+        avg_diff = np.abs(self.last_sample.astype(np.int16) - sample).mean()
         return max(0.0, min(1.0, 1.0 - (avg_diff / 255.0)))
     
-    def _calculate_histogram_similarity(self, img1: Image.Image, img2: Image.Image) -> float:
+    def _calculate_histogram_similarity(self, sample_image: Image.Image) -> float:
         """Histogramm-basierte Ähnlichkeit."""
         try:
-            # RGB-Histogramme berechnen
-            hist1 = img1.convert('RGB').histogram()
-            hist2 = img2.convert('RGB').histogram()
+            # RGB-Histogramm berechnen (Referenz-Histogramm ist gecacht)
+            hist1 = self.last_histogram
+            hist2 = self._calculate_rgb_histogram(sample_image)
             
             # Chi-Quadrat-Distanz zwischen Histogrammen
-            chi_squared = 0
-            for i in range(len(hist1)):
-                if hist1[i] + hist2[i] > 0:
-                    chi_squared += ((hist1[i] - hist2[i]) ** 2) / (hist1[i] + hist2[i])
+            denom = hist1 + hist2
+            diff_sq = (hist1 - hist2) ** 2
+            chi_squared = np.divide(diff_sq, denom, out=np.zeros(len(denom)), where=denom > 0).sum()
             
             # Normalisieren und in Ähnlichkeit umwandeln
             max_chi_squared = len(hist1) * 2  # Theoretisches Maximum
@@ -192,79 +263,92 @@ class FrameSimilarityDetector:
         except Exception:
             return 0.0
     
-    def _calculate_structural_similarity(self, img1: Image.Image, img2: Image.Image) -> float:
-        """Vereinfachte strukturelle Ähnlichkeit."""
+    @staticmethod
+    def _calculate_rgb_histogram(image: Image.Image) -> np.ndarray:
+        """Berechnet das 768-stellige RGB-Histogramm (R, G, B hintereinander)."""
+        arr = np.asarray(image.convert('RGB')).reshape(-1, 3)
+        # Kanal-Offsets, damit ein einziger bincount alle drei Histogramme liefert
+        offset = arr.astype(np.intp) + np.array([0, 256, 512], dtype=np.intp)
+        return np.bincount(offset.ravel(), minlength=768).astype(np.int64)
+    
+    def _calculate_sample(self, image: Image.Image) -> Image.Image:
+        """Verkleinert das Bild auf SAMPLE_SIZE (BOX mittelt; 'P'-Bilder nutzen NEAREST)."""
+        return image.resize(self.SAMPLE_SIZE, Image.Resampling.BOX if hasattr(Image, 'Resampling') else Image.BOX)
+    
+    @staticmethod
+    def _calculate_gray64(gray_image: Image.Image) -> np.ndarray:
+        """Verkleinert ein Graustufenbild auf 64x64."""
+        # reducing_gap verkleinert zuerst per ganzzahligem reduce(), erst den Rest mit LANCZOS
+        gray = gray_image.resize(
+            (64, 64),
+            Image.Resampling.LANCZOS if hasattr(Image, 'Resampling') else Image.LANCZOS,
+            reducing_gap=2.0
+        )
+        return np.asarray(gray)
+    
+    @staticmethod
+    def _calculate_edge_map(arr: np.ndarray) -> Tuple[np.ndarray, float, float]:
+        """
+        Berechnet eine flache, mittelwertfreie Kantenkarte aus einem Graustufen-Array.
+
+        Returns:
+            Tuple aus (zentrierte Kantenkarte, Mittelwert, euklidische Norm)
+        """
+        gray = arr.astype(np.float32)
+        # Kanten mit einfachem Sobel-ähnlichen Filter: horizontale und vertikale Gradienten,
+        # auf die gemeinsame Größe zugeschnitten
+        edges = np.abs(np.diff(gray, axis=0))[:, :-1] + np.abs(np.diff(gray, axis=1))[:-1, :]
+        edges = edges.ravel()
+        mean = float(edges.mean()) if edges.size else 0.0
+        edges -= mean
+        return edges, mean, float(np.linalg.norm(edges))
+    
+    def _calculate_structural_similarity(self, gray: np.ndarray) -> float:
+        """Vereinfachte strukturelle Ähnlichkeit auf der 64x64-Graustufenversion."""
         try:
-            # Bilder zu Graustufen konvertieren und verkleinern für Performance
-            gray1 = img1.convert('L').resize((64, 64), Image.Resampling.LANCZOS if hasattr(Image, 'Resampling') else Image.LANCZOS)
-            gray2 = img2.convert('L').resize((64, 64), Image.Resampling.LANCZOS if hasattr(Image, 'Resampling') else Image.LANCZOS)
-            
-            # Kanten mit einfachem Sobel-ähnlichen Filter
-            def detect_edges(img):
-                import numpy as np
-                arr = np.array(img)
-                # Horizontale und vertikale Gradienten
-                grad_x = np.abs(arr[1:, :] - arr[:-1, :])
-                grad_y = np.abs(arr[:, 1:] - arr[:, :-1])
-                # Kanten kombinieren (kleinere Größe nehmen)
-                min_h, min_w = min(grad_x.shape[0], grad_y.shape[0]), min(grad_x.shape[1], grad_y.shape[1])
-                edges = grad_x[:min_h, :min_w] + grad_y[:min_h, :min_w]
-                return edges
-            
-            edges1 = detect_edges(gray1)
-            edges2 = detect_edges(gray2)
-            
-            # Korrelation zwischen Kantenkarten
-            flat1 = edges1.flatten()
-            flat2 = edges2.flatten()
-            
-            if len(flat1) == 0 or len(flat2) == 0:
-                return 0.0
+            # Korrelation zwischen Kantenkarten (Referenzseite ist gecacht)
+            edges1, mean1, norm1 = self.last_edges, self.last_edges_mean, self.last_edges_norm
+            edges2, mean2, norm2 = self._calculate_edge_map(gray)
             
-            # Pearson-Korrelationskoeffizient
-            mean1, mean2 = np.mean(flat1), np.mean(flat2)
-            std1, std2 = np.std(flat1), np.std(flat2)
+            if edges1.size == 0 or edges2.size == 0:
+                return 0.0
             
-            if std1 == 0 or std2 == 0:
-                return 1.0 if np.array_equal(flat1, flat2) else 0.0
+            if norm1 == 0 or norm2 == 0:
+                # Konstante Kantenkarte: nur gleich, wenn beide konstant mit gleichem Wert sind
+                return 1.0 if norm1 == norm2 and mean1 == mean2 else 0.0
             
-            correlation = np.mean((flat1 - mean1) * (flat2 - mean2)) / (std1 * std2)
+            # Pearson-Korrelationskoeffizient als normiertes Skalarprodukt
+            correlation = float(np.dot(edges1, edges2)) / (norm1 * norm2)
             return max(0.0, min(1.0, (correlation + 1.0) / 2.0))  # Normalisierung auf [0,1]
             
         except Exception:
             return 0.0
     
-    def _calculate_local_changes_similarity(self, img1: Image.Image, img2: Image.Image) -> float:
+    def _calculate_local_changes_similarity(self, sample: np.ndarray) -> float:
         """Bewertet lokale Änderungen - wichtig für Textbearbeitung."""
         try:
-            # Differenzbild berechnen
-            diff = ImageChops.difference(img1, img2)
-            
-            # Bild in Blöcke unterteilen (z.B. 8x8 Pixel)
-            block_size = 8
-            width, height = diff.size
-            
-            total_blocks = 0
-            changed_blocks = 0
-            
-            for y in range(0, height - block_size + 1, block_size):
-                for x in range(0, width - block_size + 1, block_size):
-                    # Block extrahieren
-                    block = diff.crop((x, y, x + block_size, y + block_size))
-                    
-                    # Durchschnittliche Änderung in diesem Block
-                    stat = ImageStat.Stat(block)
-                    avg_change = sum(stat.mean) / len(stat.mean)
-                    
-                    total_blocks += 1
-                    
-                    # Block als "geändert" betrachten wenn Änderung über Schwellenwert
-                    if avg_change > 10:  # Schwellenwert für "signifikante" Änderung
-                        changed_blocks += 1
-            
-            if total_blocks == 0:
+            # Differenzbild berechnen (bei mehreren Kanälen über die Kanäle mitteln)
+            diff = np.abs(self.last_sample.astype(np.int16) - sample)
+            if diff.ndim == 3:
+                diff = diff.mean(axis=-1)
+            
+            # Bild in Blöcke unterteilen (z.B. 8x8 Pixel), Randpixel werden ignoriert
+            block_size = self.BLOCK_SIZE
+            rows = diff.shape[0] // block_size
+            cols = diff.shape[1] // block_size
+            
+            if rows == 0 or cols == 0:
                 return 1.0
             
+            # Durchschnittliche Änderung pro Block
+            blocks = diff[:rows * block_size, :cols * block_size].reshape(
+                rows, block_size, cols, block_size
+            ).mean(axis=(1, 3))
+            
+            # Block als "geändert" betrachten wenn Änderung über Schwellenwert
+            changed_blocks = np.count_nonzero(blocks > self.BLOCK_CHANGE_THRESHOLD)
+            total_blocks = blocks.size
+            
             # Anteil der unveränderten Blöcke
             unchanged_ratio = (total_blocks - changed_blocks) / total_blocks
             
@@ -297,14 +381,13 @@ class FrameSimilarityDetector:
         
         return weighted_sum / total_weight
     
-    def _calculate_structural_hash(self, image: Image.Image) -> str:
-        """Berechnet einen Hash basierend auf Bildstruktur (Kanten)."""
+    def _calculate_structural_hash(self, gray_image: Image.Image) -> bytes:
+        """Berechnet einen Hash basierend auf Bildstruktur (Kanten) eines Graustufenbilds."""
         try:
-            # Zu Graustufen und kleine Größe für schnellen Vergleich
-            gray = image.convert('L').resize((16, 16), Image.Resampling.NEAREST if hasattr(Image, 'Resampling') else Image.NEAREST)
+            # Kleine Größe für schnellen Vergleich
+            gray = gray_image.resize((16, 16), Image.Resampling.NEAREST if hasattr(Image, 'Resampling') else Image.NEAREST)
             
             # Einfache Kantenerkennung durch Differenzen
-            import numpy as np
             arr = np.array(gray)
             
             # Horizontale und vertikale Gradienten
@@ -317,81 +400,130 @@ class FrameSimilarityDetector:
             
             # Binarisierung (starke Kanten vs. schwache)
             threshold = np.mean(combined) + np.std(combined)
-            binary = (combined > threshold).astype(np.uint8)
+            binary = combined > threshold
             
-            # Hash der Binärstruktur
-            return hashlib.md5(binary.tobytes()).hexdigest()
+            # Binärstruktur als gepackte Bits
+            return np.packbits(binary).tobytes()
             
         except Exception:
             # Fallback auf einfachen Hash
-            return self._calculate_image_hash(image)
+            return self._calculate_image_hash(gray_image).to_bytes(8, 'big')
     
-    def _update_reference(self, image: Image.Image) -> None:
-        """Aktualisiert das Referenz-Frame."""
-        self.last_processed_image = image.copy()
-        self.last_frame_hash = self._calculate_image_hash(image)
-        self.last_structural_hash = self._calculate_structural_hash(image)
+    def _update_reference(self, image: Image.Image, gray_image: Optional[Image.Image] = None) -> None:
+        """Aktualisiert das Referenz-Frame und die daraus abgeleiteten Vergleichsdaten."""
+        if gray_image is None:
+            gray_image = image.convert('L')
+        # Nur abgeleitete Daten behalten - np.asarray liefert bereits eine eigene Kopie
+        sample_image = self._calculate_sample(image)
+        self.last_sample = np.asarray(sample_image)
+        self.last_histogram = self._calculate_rgb_histogram(sample_image)
+        gray = self._calculate_gray64(gray_image)
+        self.last_gray64 = gray.astype(np.float32)
+        self.last_edges, self.last_edges_mean, self.last_edges_norm = self._calculate_edge_map(gray)
+        self.last_frame_hash = self._calculate_image_hash(gray_image)
+        self.last_structural_hash = self._calculate_structural_hash(gray_image)
     
-    def _calculate_image_hash(self, image: Image.Image) -> str:
-        """Berechnet einen schnellen Hash für das Bild."""
-        small_image = image.resize((8, 8), Image.Resampling.NEAREST if hasattr(Image, 'Resampling') else Image.NEAREST)
-        return hashlib.md5(small_image.tobytes()).hexdigest()
+    def _calculate_image_hash(self, gray_image: Image.Image) -> int:
+        """Berechnet einen 64-Bit-Differenz-Hash (dHash) für ein Graustufenbild."""
+        # BOX mittelt über alle Pixel, damit auch kleine Änderungen den Hash beeinflussen
+        small_image = gray_image.resize((9, 8), Image.Resampling.BOX if hasattr(Image, 'Resampling') else Image.BOX)
+        gray = np.asarray(small_image)
+        # Ein Bit pro Pixel: heller als der rechte Nachbar
+        bits = gray[:, :-1] > gray[:, 1:]
+        # 64 Bits direkt als uint64 lesen, ohne Umweg über ein bytes-Objekt
+        return np.packbits(bits).view('>u8')[0].item()
     
     def reset(self) -> None:
         """Setzt den Detektor zurück."""
         self.last_frame_hash = None
-        self.last_processed_image = None
+        self.last_sample = None
         self.last_histogram = None
+        self.last_gray64 = None
+        self.last_edges = None
+        self.last_edges_mean = 0.0
+        self.last_edges_norm = 0.0
         self.last_structural_hash = None
+        self.scene_changed = False
 
 class ImageConverter:
     """Handles conversion between QImage and PIL Image formats."""
     
+    # Qt 6 removed QImage.byteCount(); the accessor is picked once, not per frame
+    _image_size_in_bytes = staticmethod(QImage.sizeInBytes if QT_VERSION == 6 else QImage.byteCount)
+    
     @staticmethod
     def qimage_to_pil(qimage: QImage) -> Image.Image:
-        """Convert QImage to PIL Image with proper format handling."""
+        """Convert a 32-bit QImage to an RGB PIL Image (alpha is dropped)."""
         try:
             # Get image data pointer
             ptr = qimage.constBits()
+            ptr.setsize(ImageConverter._image_size_in_bytes(qimage))
             
-            # Set buffer size based on Qt version
-            if QT_VERSION == 6:
-                ptr.setsize(qimage.sizeInBytes())
-            else:
-                ptr.setsize(qimage.byteCount())
-            
-            # Convert to PIL Image
-            pil_image = Image.frombuffer(
-                'RGBA', 
-                (qimage.width(), qimage.height()), 
-                ptr, 
-                'raw', 
-                'BGRA',  # Qt uses BGRA format
-                0, 
-                1
-            )
+            # View the pixel data without copying; rows may be padded to bytesPerLine
+            width, height = qimage.width(), qimage.height()
+            arr = np.frombuffer(ptr, dtype=np.uint8).reshape(height, qimage.bytesPerLine() // 4, 4)
             
-            return pil_image
+            # Qt uses BGRA byte order - take BGR reversed in a single copy
+            rgb = np.ascontiguousarray(arr[:, :width, 2::-1])
+            return Image.fromarray(rgb, 'RGB')
             
         except Exception as e:
             raise RuntimeError(f"Failed to convert QImage to PIL Image: {e}") from e
     
     @staticmethod
-    def process_image(pil_image: Image.Image, settings: GifSettings) -> Image.Image:
-        """Process a PIL image according to GIF settings."""
+    def process_image(
+        pil_image: Image.Image,
+        settings: GifSettings,
+        palette_source: Optional[Image.Image] = None
+    ) -> Image.Image:
+        """
+        Process a PIL image according to GIF settings.
+
+        Args:
+            pil_image: Source image
+            settings: GIF settings to apply
+            palette_source: Optional 'P' image whose palette is reused instead of
+                computing a new one for this frame
+        """
+        scaled_image = ImageConverter.scale_image(pil_image, settings)
+        return ImageConverter.quantize_image(scaled_image, settings, palette_source)
+    
+    @staticmethod
+    def scale_image(pil_image: Image.Image, settings: GifSettings) -> Image.Image:
+        """Scale a PIL image by the configured factor and convert it to RGB."""
         try:
-            # Apply scaling if needed
-            if settings.scale_factor < 1.0:
+            # Apply scaling if needed; exact 1/n scales use the fast integer box reduce
+            if settings.reduce_factor and pil_image.mode in ('RGB', 'RGBA', 'L'):
+                pil_image = pil_image.reduce(settings.reduce_factor)
+            elif settings.scale_factor < 1.0:
                 new_width = int(pil_image.width * settings.scale_factor)
                 new_height = int(pil_image.height * settings.scale_factor)
                 new_size = (max(1, new_width), max(1, new_height))
                 pil_image = pil_image.resize(new_size, resample=settings.pil_resample)
 
-            # Convert to RGB
-            rgb_image = pil_image.convert('RGB')
+            # Convert to RGB (frames from qimage_to_pil already are)
+            return pil_image if pil_image.mode == 'RGB' else pil_image.convert('RGB')
 
+        except Exception as e:
+            raise RuntimeError(f"Failed to scale image: {e}") from e
+    
+    @staticmethod
+    def quantize_image(
+        rgb_image: Image.Image,
+        settings: GifSettings,
+        palette_source: Optional[Image.Image] = None
+    ) -> Image.Image:
+        """Quantize an RGB image to the configured palette size."""
+        try:
+            if palette_source is not None:
+                # Reuse an existing palette - skips the median-cut palette generation
+                quantized_image = rgb_image.quantize(
+                    colors=settings.effective_num_colors,
+                    palette=palette_source,
+                    dither=settings.pil_dither # type: ignore
+                )
             # Dithering workaround: first quantize to get palette, then quantize again with dither
-            if settings.use_dithering:
+            elif settings.use_dithering:
                 # Step 1: Quantize without dithering to get the palette
                 temp_quantized = rgb_image.quantize(colors=settings.effective_num_colors)
 
@@ -411,8 +543,118 @@ class ImageConverter:
             raise RuntimeError(f"Failed to process image: {e}") from e
 
 
+class GifStreamWriter:
+    """
+    Writes GIF frames to disk as they arrive instead of collecting them first.
+
+    Only the previous frame is kept: unchanged frames extend the duration of the
+    pending one, changed frames are cropped to the region that differs from it.
+    """
+    
+    def __init__(self, fp, duration_ms: int, disposal: int = 0, loop: int = 0):
+        self.fp = fp
+        self.duration_ms = duration_ms
+        self.disposal = disposal
+        self.loop = loop
+        self.frame_count = 0
+        self._global_palette: Optional[List[int]] = None
+        self._previous: Optional[Image.Image] = None
+        self._pending: Optional[Tuple[Image.Image, Optional[Tuple[int, int, int, int]], int]] = None
+    
+    def write_frame(self, image: Image.Image) -> None:
+        """Add one 'P' mode frame to the GIF."""
+        if self._previous is None:
+            header, _ = GifImagePlugin.getheader(image, info={'loop': self.loop, 'duration': self.duration_ms})
+            for block in header:
+                self.fp.write(block)
+            self._global_palette = image.getpalette()
+            self._previous = image
+            self._pending = (image, None, self.duration_ms)
+            return
+        
+        bbox = self._changed_region(self._previous, image)
+        if bbox is None:
+            # Identical to the previous frame - just show that one longer
+            frame, frame_bbox, duration = self._pending
+            self._pending = (frame, frame_bbox, duration + self.duration_ms)
+            return
+        
+        self._flush_pending()
+        # Delta frames rely on the previous frame staying on screen
+        if self.disposal not in (0, 1):
+            bbox = None
+        self._previous = image
+        self._pending = (image, bbox, self.duration_ms)
+    
+    def close(self) -> None:
+        """Write the last frame and the GIF trailer."""
+        self._flush_pending()
+        if self.frame_count:
+            self.fp.write(b";")
+    
+    def _flush_pending(self) -> None:
+        if self._pending is None:
+            return
+        frame, bbox, duration = self._pending
+        self._pending = None
+        
+        offset = (0, 0)
+        if bbox is not None:
+            frame = frame.crop(bbox)
+            offset = bbox[:2]
+        
+        for block in GifImagePlugin.getdata(
+            frame, offset,
+            duration=duration,
+            disposal=self.disposal,
+            include_color_table=frame.getpalette() != self._global_palette
+        ):
+            self.fp.write(block)
+        self.frame_count += 1
+    
+    @staticmethod
+    def _changed_region(
+        previous: Image.Image, current: Image.Image
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """Bounding box of the pixels that differ, or None if the frames are identical."""
+        if previous.getpalette() != current.getpalette():
+            previous, current = previous.convert('RGB'), current.convert('RGB')
+        return ImageChops.difference(current, previous).getbbox()
+
+
+class _SaveCancelled(Exception):
+    """Raised on the worker thread when it stops because the user cancelled."""
+
+
+class GifSaveWorker(QThread):
+    """Runs frame processing and GIF writing off the GUI thread."""
+    
+    # Signals are delivered to the GUI thread, which owns the progress dialog
+    progress_changed = pyqtSignal(int, str)  # step, status text
+    frame_processed = pyqtSignal(int)  # frame index for the external progress callback
+    
+    def __init__(self, job: Callable[[], object]):
+        super().__init__()
+        self._job = job
+        self.result = None
+        self.error: Optional[Exception] = None
+    
+    def run(self):
+        try:
+            self.result = self._job()
+        except Exception as e:
+            self.error = e
+
+
 class ProgressManager:
-    """Manages progress dialog and callbacks with unified progress tracking."""
+    """Manages progress dialog and callbacks with unified progress tracking.
+    
+    The update methods may be called from a GifSaveWorker thread; they then only
+    emit signals and never touch the dialog directly.
+    """
+    
+    # Minimum time between dialog refreshes / event processing (~30 Hz)
+    UPDATE_INTERVAL_S = 0.033
     
     def __init__(self, parent_widget, total_frames: int, 
                  progress_callback: Optional[Callable[[int], None]] = None):
@@ -426,6 +668,9 @@ class ProgressManager:
         self.saving_steps = 1  # GIF saving is one step
         self.total_steps = self.frames_processing_steps + self.saving_steps
         self.current_step = 0
+        self._last_pump = 0.0
+        self._cancelled = False
+        self.worker: Optional[GifSaveWorker] = None
     
     @contextmanager
     def progress_context(self):
@@ -448,54 +693,71 @@ class ProgressManager:
         self.dialog.setWindowModality(Qt.WindowModality.WindowModal)
         self.dialog.setWindowTitle("Saving GIF")
         self.dialog.setMinimumDuration(0)  # Show immediately
+        self.dialog.canceled.connect(self._on_canceled)
         self.dialog.show()
         
         # Process events to ensure dialog is visible
         QApplication.processEvents()
     
+    def run_worker(self, worker: GifSaveWorker):
+        """
+        Run worker while keeping the GUI responsive; returns its result.
+        
+        Raises:
+            Exception: Whatever the worker's job raised
+        """
+        self.worker = worker
+        queued = Qt.ConnectionType.QueuedConnection
+        worker.progress_changed.connect(self._show_progress, queued)
+        worker.frame_processed.connect(self._notify_callback, queued)
+        
+        loop = QEventLoop()
+        worker.finished.connect(loop.quit, queued)
+        worker.start()
+        loop.exec()
+        worker.wait()
+        self.worker = None
+        
+        if worker.error is not None:
+            raise worker.error
+        return worker.result
+    
     def update_frame_progress(self, current_frame: int, status: str = "") -> bool:
         """Update progress for frame processing phase."""
         if not self.dialog:
             return False
         
-        if self.dialog.wasCanceled():
-            return True
-        
         # Current step is the frame number
         self.current_step = current_frame
         
-        # Update dialog
-        self.dialog.setValue(self.current_step)
-        if status:
-            self.dialog.setLabelText(status)
-        
-        # Process events to keep UI responsive
-        QApplication.processEvents()
-        
-        # Call external callback
-        if self.progress_callback:
-            try:
-                self.progress_callback(current_frame)
-            except Exception as e:
-                print(f"Progress callback error: {e}")
+        # Only refresh the dialog at a limited rate; first and last frame always
+        now = time.monotonic()
+        is_boundary = current_frame == 0 or current_frame >= self.total_frames - 1
+        if is_boundary or now - self._last_pump >= self.UPDATE_INTERVAL_S:
+            self._last_pump = now
+            
+            if self.is_cancelled():
+                return True
+            
+            self._report(self.current_step, status)
+            if self.worker:
+                self.worker.frame_processed.emit(current_frame)
+            else:
+                self._notify_callback(current_frame)
         
         return False
     
-    def start_saving_phase(self) -> bool:
-        """Start the GIF saving phase."""
+    def start_saving_phase(self, status: str = "Writing GIF file...") -> bool:
+        """Start (or relabel) the GIF saving phase."""
         if not self.dialog:
             return False
         
-        if self.dialog.wasCanceled():
+        if self.is_cancelled():
             return True
         
         # Move to saving phase
         self.current_step = self.frames_processing_steps
-        self.dialog.setValue(self.current_step)
-        self.dialog.setLabelText("Writing GIF file...")
-
-        # Process events to update UI
-        QApplication.processEvents()
+        self._report(self.current_step, status)
         
         return False
     
@@ -513,8 +775,33 @@ class ProgressManager:
         QApplication.processEvents()
     
     def is_cancelled(self) -> bool:
-        """Check if operation was cancelled."""
-        return self.dialog and self.dialog.wasCanceled()
+        """Check if operation was cancelled (safe to call from the worker thread)."""
+        return self._cancelled
+    
+    def _on_canceled(self) -> None:
+        self._cancelled = True
+    
+    def _report(self, step: int, status: str) -> None:
+        """Forward progress to the dialog, via the GUI thread when a worker is running."""
+        if self.worker:
+            self.worker.progress_changed.emit(step, status)
+        else:
+            self._show_progress(step, status)
+            QApplication.processEvents()
+    
+    def _show_progress(self, step: int, status: str) -> None:
+        if not self.dialog:
+            return
+        self.dialog.setValue(step)
+        if status:
+            self.dialog.setLabelText(status)
+    
+    def _notify_callback(self, current_frame: int) -> None:
+        if self.progress_callback:
+            try:
+                self.progress_callback(current_frame)
+            except Exception as e:
+                print(f"Progress callback error: {e}")
     
     def _cleanup_dialog(self) -> None:
         """Clean up progress dialog."""
@@ -526,6 +813,16 @@ class ProgressManager:
 class GifSaver:
     """Main class for saving frames as GIF files."""
     
+    # Number of kept frames after which the shared palette is regenerated
+    PALETTE_REFRESH_INTERVAL = 30
+    # Frames converted ahead per worker thread; bounds memory held by the prefetch
+    PREFETCH_PER_WORKER = 2
+    # gifsicle --lossy value per GifSettings.lossy_level step
+    GIFSICLE_LOSSY_PER_LEVEL = 20
+    # Frames sampled (evenly spaced) to build the global palette, and their maximum width
+    GLOBAL_PALETTE_SAMPLES = 8
+    GLOBAL_PALETTE_SAMPLE_WIDTH = 480
+    
     def __init__(self):
         self.converter = ImageConverter()
     
@@ -594,20 +891,17 @@ class GifSaver:
         progress_manager = ProgressManager(parent_widget, len(frames), progress_callback)
         
         with progress_manager.progress_context():
-            # Process all frames
-            processed_images = self._process_frames(frames, settings, progress_manager)
-            
-            if not processed_images or progress_manager.is_cancelled():
-                return None
-            
-            # Start saving phase
-            if progress_manager.start_saving_phase():
-                return None  # Cancelled
-            
-            # Save the GIF
-            self._save_gif_file(processed_images, settings, filename, progress_manager)
+            # Processing and writing run on a worker thread so the dialog stays responsive.
+            # Only the worker decides whether it was cancelled; a late Cancel click after
+            # it finished must not discard a complete file.
+            try:
+                written = progress_manager.run_worker(GifSaveWorker(
+                    lambda: self._write_gif(frames, settings, filename, progress_manager)
+                ))
+            except _SaveCancelled:
+                return None  # Any partial file was already removed by the worker
             
-            if progress_manager.is_cancelled():
+            if not written:
                 return None
             
             # Mark as complete
@@ -617,15 +911,53 @@ class GifSaver:
             self._show_success(parent_widget, filename)
             return filename
 
+    def _write_gif(
+        self,
+        frames: List[QImage],
+        settings: GifSettings,
+        filename: str,
+        progress_manager: ProgressManager
+    ) -> bool:
+        """
+        Process frames and write the GIF file; runs on the GifSaveWorker thread.
+        
+        Returns False if there was nothing to write.
+        
+        Raises:
+            _SaveCancelled: The user cancelled; no file is left behind
+        """
+        # Frames are processed lazily while the GIF encoder consumes them
+        processed_images = self._process_frames(frames, settings, progress_manager)
+        first_image = next(processed_images, None)
+        
+        if first_image is None:
+            return False
+        
+        # Save the GIF, then let gifsicle optimize it if installed
+        gifsicle = shutil.which('gifsicle') if settings.use_gifsicle else None
+        self._save_gif_file(first_image, processed_images, settings, filename, progress_manager)
+        
+        if gifsicle:
+            self._optimize_with_gifsicle(gifsicle, filename, settings, progress_manager)
+        
+        return True
+
     # marker2
     def _process_frames(
         self,
         frames: List[QImage],
         settings: GifSettings,
         progress_manager: ProgressManager
-    ) -> Optional[List[Image.Image]]:
-        """Process all frames and return PIL images mit Ähnlichkeitsprüfung."""
-        processed_images = []
+    ) -> Iterator[Image.Image]:
+        """
+        Process frames mit Ähnlichkeitsprüfung, yielding each kept PIL image.
+
+        Conversion, scaling and quantization run on a thread pool (Pillow releases
+        the GIL for them); the similarity check and palette bookkeeping stay in order.
+        Raises _SaveCancelled when the user cancels.
+        Once all frames are processed the progress dialog moves to the saving phase.
+        """
+        kept_count = 0
 
         # Ähnlichkeitsdetektor initialisieren
         similarity_detector = None
@@ -634,67 +966,205 @@ class GifSaver:
 
         skipped_count = 0
 
-        for i, qimage in enumerate(frames):
-            # Check for cancellation
-            status_text = f"Processing frame {i + 1}/{len(frames)}"
-            if skipped_count > 0:
-                status_text += f" (skipped {skipped_count} similar)"
+        # Palette shared between consecutive frames; either one global palette or
+        # regenerated periodically and on scene changes
+        palette_ref = None
+        palette_age = 0
+        if settings.use_global_palette:
+            palette_ref = self._build_global_palette(frames, settings)
 
-            if progress_manager.update_frame_progress(i, status_text):
-                return None  # Cancelled
+        workers = os.cpu_count() or 1
+        lookahead = workers * self.PREFETCH_PER_WORKER
 
-            try:
-                # Convert and process image
-                pil_image = self.converter.qimage_to_pil(qimage)
-                processed_image = self.converter.process_image(pil_image, settings)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # (frame index, future) of kept frames still being quantized, in frame order
+            pending = deque()
 
-                # Ähnlichkeitsprüfung
-                if similarity_detector and similarity_detector.is_similar_to_previous(processed_image):
-                    skipped_count += 1
-                    continue  # Frame überspringen
+            for i, prepare_future in enumerate(self._prepare_frames(frames, settings, executor)):
+                # Check for cancellation
+                status_text = f"Processing frame {i + 1}/{len(frames)}"
+                if skipped_count > 0:
+                    status_text += f" (skipped {skipped_count} similar)"
 
-                processed_images.append(processed_image)
+                if progress_manager.update_frame_progress(i, status_text):
+                    raise _SaveCancelled()
 
-            except Exception as e:
-                raise RuntimeError(f"Failed to process frame {i + 1}: {e}") from e
+                try:
+                    # Converted and scaled on a worker thread
+                    rgb_image = prepare_future.result()
+
+                    # Ähnlichkeitsprüfung vor der Quantisierung - übersprungene Frames kosten kein quantize
+                    if similarity_detector and similarity_detector.is_similar_to_previous(rgb_image):
+                        skipped_count += 1
+                        continue  # Frame überspringen
+
+                    # Regenerate the shared palette periodically and on scene changes
+                    if not settings.use_global_palette and (
+                            palette_age >= self.PALETTE_REFRESH_INTERVAL or
+                            (similarity_detector and similarity_detector.scene_changed)):
+                        palette_ref = None
+                    quantize_future = executor.submit(
+                        self.converter.quantize_image, rgb_image, settings, palette_ref
+                    )
+
+                    if palette_ref is None:
+                        # Later frames depend on this palette, so wait for it
+                        palette_ref = quantize_future.result()
+                        palette_age = 0
+                    palette_age += 1
+
+                except Exception as e:
+                    raise RuntimeError(f"Failed to process frame {i + 1}: {e}") from e
+
+                kept_count += 1
+                pending.append((i, quantize_future))
+                while len(pending) > lookahead:
+                    yield self._quantized_result(*pending.popleft())
+
+            while pending:
+                yield self._quantized_result(*pending.popleft())
 
         # Final frame processing update
-        final_status = f"Processed {len(processed_images)} frames"
+        final_status = f"Processed {kept_count} frames"
         if skipped_count > 0:
             final_status += f" (skipped {skipped_count} similar frames)"
         progress_manager.update_frame_progress(len(frames), final_status)
 
-        return processed_images
+        # The encoder writes the file once this generator is exhausted
+        progress_manager.start_saving_phase()
+
+    def _build_global_palette(self, frames: List[QImage], settings: GifSettings) -> Image.Image:
+        """
+        Build one palette for the whole GIF from evenly spaced sample frames.
+
+        The samples are shrunk with NEAREST (keeps exact colors) and stacked into one
+        image, which is quantized once; its palette is then reused for every frame.
+        """
+        count = min(self.GLOBAL_PALETTE_SAMPLES, len(frames))
+        indices = sorted({round(k * (len(frames) - 1) / max(1, count - 1)) for k in range(count)})
+
+        samples = []
+        for index in indices:
+            sample = self.converter.scale_image(self.converter.qimage_to_pil(frames[index]), settings)
+            if sample.width > self.GLOBAL_PALETTE_SAMPLE_WIDTH:
+                height = max(1, sample.height * self.GLOBAL_PALETTE_SAMPLE_WIDTH // sample.width)
+                sample = sample.resize(
+                    (self.GLOBAL_PALETTE_SAMPLE_WIDTH, height),
+                    Image.Resampling.NEAREST if hasattr(Image, 'Resampling') else Image.NEAREST
+                )
+            samples.append(sample)
+
+        mosaic = Image.new('RGB', (max(s.width for s in samples), sum(s.height for s in samples)))
+        top = 0
+        for sample in samples:
+            mosaic.paste(sample, (0, top))
+            top += sample.height
+
+        return mosaic.quantize(colors=settings.effective_num_colors)
+
+    @staticmethod
+    def _quantized_result(index: int, future) -> Image.Image:
+        """Wait for a queued quantization and attach the frame number to failures."""
+        try:
+            return future.result()
+        except Exception as e:
+            raise RuntimeError(f"Failed to process frame {index + 1}: {e}") from e
+
+    def _prepare_frames(
+        self,
+        frames: List[QImage],
+        settings: GifSettings,
+        executor: ThreadPoolExecutor
+    ) -> Iterator:
+        """
+        Convert and scale frames on the executor, yielding futures in frame order.
+
+        Only a bounded number of frames is submitted ahead of the consumer.
+        """
+        def prepare(qimage: QImage) -> Image.Image:
+            return self.converter.scale_image(self.converter.qimage_to_pil(qimage), settings)
+
+        lookahead = (os.cpu_count() or 1) * self.PREFETCH_PER_WORKER
+        pending = deque()
+        for index, qimage in enumerate(frames):
+            pending.append(executor.submit(prepare, qimage))
+            if index >= lookahead:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
 
     def _save_gif_file(
         self,
-        images: List[Image.Image],
+        first_image: Image.Image,
+        more_images: Iterable[Image.Image],
         settings: GifSettings,
         filename: str,
         progress_manager: ProgressManager
     ) -> None:
-        """Save processed images as GIF file."""
-        if not images:
-            raise ValueError("No images to save")
+        """Save processed images as GIF file, writing each frame as more_images yields it."""
+        try:
+            # Progress comes from the frame generator; only one frame is held at a time
+            with open(filename, 'wb') as fp:
+                writer = GifStreamWriter(
+                    fp,
+                    settings.frame_duration_ms,
+                    disposal=settings.disposal_method,
+                    loop=0  # Infinite loop
+                )
+                writer.write_frame(first_image)
+                for image in more_images:
+                    writer.write_frame(image)
+                writer.close()
+        except _SaveCancelled:
+            self._remove_partial_file(filename)
+            raise
+        except Exception as e:
+            self._remove_partial_file(filename)
+            raise RuntimeError(f"Failed to save GIF file: {e}") from e
 
-        # Check for cancellation before starting save
-        if progress_manager.is_cancelled():
+    def _optimize_with_gifsicle(
+        self,
+        gifsicle: str,
+        filename: str,
+        settings: GifSettings,
+        progress_manager: ProgressManager
+    ) -> None:
+        """Optimize the written GIF in place with gifsicle; keeps the file as is on failure."""
+        if progress_manager.start_saving_phase("Optimizing GIF..."):
+            self._remove_partial_file(filename)
+            raise _SaveCancelled()
+
+        command = [gifsicle, '-O3', '-b', filename]
+        if settings.lossy_level > 0:
+            command.insert(2, f'--lossy={settings.lossy_level * self.GIFSICLE_LOSSY_PER_LEVEL}')
+
+        try:
+            process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError as e:
+            print(f"gifsicle could not be started: {e}")
             return
 
+        # Runs on the worker thread; wake up regularly only to notice a cancel
+        while True:
+            try:
+                process.wait(timeout=progress_manager.UPDATE_INTERVAL_S)
+                break
+            except subprocess.TimeoutExpired:
+                if progress_manager.is_cancelled():
+                    process.kill()
+                    process.wait()
+                    self._remove_partial_file(filename)
+                    raise _SaveCancelled()
+
+        if process.returncode != 0:
+            print(f"gifsicle exited with code {process.returncode}; keeping unoptimized GIF")
+
+    def _remove_partial_file(self, filename: str) -> None:
+        """Delete an incompletely written GIF file."""
         try:
-            # Save with PIL - this operation doesn't provide progress callbacks
-            # so we just show a general "saving" message
-            images[0].save(
-                filename,
-                save_all=True,
-                append_images=images[1:],
-                duration=settings.frame_duration_ms,
-                loop=0,  # Infinite loop
-                optimize=True,
-                disposal=settings.disposal_method
-            )
-        except Exception as e:
-            raise RuntimeError(f"Failed to save GIF file: {e}") from e
+            Path(filename).unlink()
+        except OSError:
+            pass
     
     def _show_success(self, parent_widget, filename: str) -> None:
         """Show success message to user."""
@@ -729,7 +1199,9 @@ def save_gif_from_frames(
     disposal_method: int = 0,
     similarity_threshold: float = 0.95,  # NEU
     enable_similarity_skip: bool = True,  # NEU
-    progress_callback: Optional[Callable[[int], None]] = None
+    progress_callback: Optional[Callable[[int], None]] = None,
+    use_global_palette: bool = True,
+    use_gifsicle: bool = True
 ) -> Optional[str]:
     """
     Legacy function wrapper für Rückwärtskompatibilität mit neuen Ähnlichkeitsparametern.
@@ -743,12 +1215,17 @@ def save_gif_from_frames(
         scale_factor: Scale factor for resizing (0.0-1.0)
         num_colors: Number of colors in the palette (2-256)
         use_dithering: Whether to use dithering
-        skip_value: Use every nth frame (1 = all frames)
+        skip_value: Step used when picking frames (1 = all frames). The caller
+            passes the already decimated frames; only the duration is scaled
         lossy_level: Additional compression level (0-10)
         disposal_method: GIF disposal method (0-3)
         similarity_threshold: Threshold for frame similarity (0.0-1.0)
         enable_similarity_skip: Whether to skip similar frames
         progress_callback: Optional callback for progress updates
+        use_global_palette: Quantize all frames to one palette built from sampled
+            frames; False adapts the palette over time instead
+        use_gifsicle: Run gifsicle -O3 (and --lossy for lossy_level > 0) on the
+            written file when the gifsicle binary is available
 
     Returns:
         Filename if successful, None if cancelled or failed.
@@ -763,7 +1240,9 @@ def save_gif_from_frames(
             lossy_level=lossy_level,
             disposal_method=disposal_method,
             similarity_threshold=similarity_threshold,  # NEU
-            enable_similarity_skip=enable_similarity_skip  # NEU
+            enable_similarity_skip=enable_similarity_skip,  # NEU
+            use_global_palette=use_global_palette,
+            use_gifsicle=use_gifsicle
         )
 
 
@@ -819,6 +1298,10 @@ def validate_gif_settings(
         return False, str(e)
 
 
+# Pixel bits used by estimate_gif_size, indexed by the bit length of num_colors - 1
+_BITS_PER_PIXEL = (1, 1, 2, 4, 4, 8, 8, 8, 8)
+
+
 def estimate_gif_size(
     frame_count: int,
     width: int,
@@ -843,15 +1326,8 @@ def estimate_gif_size(
     palette_size = num_colors * 3  # RGB values
     header_size = 1024  # Approximate header size
     
-    # Estimate bytes per pixel (compressed)
-    if num_colors <= 2:
-        bits_per_pixel = 1
-    elif num_colors <= 4:
-        bits_per_pixel = 2
-    elif num_colors <= 16:
-        bits_per_pixel = 4
-    else:
-        bits_per_pixel = 8
+    # Estimate bytes per pixel (compressed): index bits rounded up to 1, 2, 4 or 8
+    bits_per_pixel = _BITS_PER_PIXEL[min(max(1, (num_colors - 1).bit_length()), 8)]
     
     bytes_per_pixel = bits_per_pixel / 8
     compression_ratio = 0.7  # Assume 30% compression
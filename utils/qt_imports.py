@@ -3,17 +3,57 @@
 import sys
 
 try:
-    from PyQt6.QtWidgets import *
-    from PyQt6.QtCore import QTimer, QPoint, QRect, Qt, QSize, QThread, pyqtSignal
-    from PyQt6.QtGui import *
+    from PyQt6.QtWidgets import (
+        QApplication, QCheckBox, QComboBox, QDialog, QFileDialog, QFormLayout,
+        QFrame, QGroupBox, QHBoxLayout, QLabel, QLineEdit, QMainWindow, QMessageBox,
+        QPlainTextEdit, QProgressDialog, QPushButton, QSizeGrip, QSizePolicy,
+        QSlider, QSpacerItem, QSpinBox, QTabWidget, QToolTip, QVBoxLayout, QWidget
+    )
+    from PyQt6.QtCore import (
+        QTimer, QPoint, QRect, Qt, QSize, QThread, pyqtSignal, QSignalBlocker,
+        QObject, QEvent, QEventLoop, QSettings, QThreadPool, QRunnable, QElapsedTimer
+    )
+    from PyQt6.QtGui import (
+        QBrush, QCloseEvent, QColor, QCursor, QImage, QMouseEvent, QMoveEvent,
+        QPaintEvent, QPainter, QPalette, QPen, QPixmap, QRegion, QResizeEvent,
+        QKeySequence, QShortcut
+    )
     QT_VERSION = 6
 except ImportError:
     try:
-        from PyQt5.QtWidgets import *
-        from PyQt5.QtCore import QTimer, QPoint, QRect, Qt, QSize, QThread, pyqtSignal
-        from PyQt5.QtGui import *
+        from PyQt5.QtWidgets import (
+            QApplication, QCheckBox, QComboBox, QDialog, QFileDialog,
+            QFormLayout, QFrame, QGroupBox, QHBoxLayout, QLabel, QLineEdit,
+            QMainWindow, QMessageBox, QPlainTextEdit, QProgressDialog,
+            QPushButton, QShortcut, QSizeGrip, QSizePolicy, QSlider, QSpacerItem, QSpinBox,
+            QTabWidget, QToolTip, QVBoxLayout, QWidget
+        )
+        from PyQt5.QtCore import (
+            QTimer, QPoint, QRect, Qt, QSize, QThread, pyqtSignal,
+            QSignalBlocker, QObject, QEvent, QEventLoop, QSettings, QThreadPool, QRunnable,
+            QElapsedTimer
+        )
+        from PyQt5.QtGui import (
+            QBrush, QCloseEvent, QColor, QCursor, QImage, QMouseEvent,
+            QMoveEvent, QPaintEvent, QPainter, QPalette, QPen, QPixmap, QRegion,
+            QResizeEvent, QKeySequence
+        )
         QT_VERSION = 5
     except ImportError:
         print("Error: PyQt5 or PyQt6 must be installed!")
         print("Installation: pip install PyQt6 pillow")
         sys.exit(1)
+
+__all__ = [
+    'QApplication', 'QCheckBox', 'QComboBox', 'QDialog', 'QFileDialog', 'QFormLayout',
+    'QFrame', 'QGroupBox', 'QHBoxLayout', 'QLabel', 'QLineEdit', 'QMainWindow',
+    'QMessageBox', 'QPlainTextEdit', 'QProgressDialog', 'QPushButton', 'QSizeGrip',
+    'QSizePolicy', 'QSlider', 'QSpacerItem', 'QSpinBox', 'QTabWidget', 'QToolTip',
+    'QVBoxLayout', 'QWidget', 'QTimer', 'QPoint', 'QRect', 'Qt', 'QSize', 'QThread',
+    'pyqtSignal', 'QSignalBlocker', 'QObject', 'QEvent', 'QEventLoop', 'QSettings', 'QThreadPool', 'QRunnable',
+    'QElapsedTimer',
+    'QBrush', 'QCloseEvent', 'QColor', 'QCursor', 'QImage', 'QMouseEvent', 'QMoveEvent',
+    'QPaintEvent', 'QPainter', 'QPalette', 'QPen', 'QPixmap', 'QRegion', 'QResizeEvent',
+    'QKeySequence', 'QShortcut',
+    'QT_VERSION'
+]
@@ -1,4 +1,7 @@
-from utils.qt_imports import *
+from utils.qt_imports import (
+    QDialog, QFormLayout, QGroupBox, QHBoxLayout, QLabel, QLineEdit, QMessageBox,
+    QPushButton, QVBoxLayout
+)
 from core.data_classes import HotkeyConfig
 from managers.config_manager import ConfigManager
 
@@ -1,7 +1,63 @@
-from typing import List, Optional
-from utils.qt_imports import *
+from collections import OrderedDict, deque
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+from utils.qt_imports import (
+    QWidget, QLabel, QPushButton, QCheckBox, QSlider, QSpinBox, QGroupBox, QHBoxLayout,
+    QVBoxLayout, QSizePolicy, QMessageBox, QImage, QPixmap, QSize, QTimer, Qt,
+    pyqtSignal, QObject, QRunnable, QThreadPool, QSignalBlocker, QElapsedTimer, QKeySequence, QShortcut
+)
 from widgets.range_slider import RangeSlider
 
+
+class _ScaleSignals(QObject):
+    """Carries frames scaled on pool threads back to the GUI thread."""
+    frame_scaled = pyqtSignal(int, int, QSize, QImage)  # generation, frame id, target size, image
+
+
+class _ScaleTask(QRunnable):
+    """Smooth-scales one frame on a pool thread (QImage, unlike QPixmap, is usable off the GUI thread)."""
+    
+    def __init__(self, signals: _ScaleSignals, generation: int, frame_id: int, image: QImage, size: QSize,
+                 still_wanted: Optional[Callable[[Tuple[int, Tuple[int, int]]], bool]] = None):
+        super().__init__()
+        self.signals = signals
+        self.generation = generation
+        self.frame_id = frame_id
+        self.image = image
+        self.size = size
+        self.still_wanted = still_wanted  # Set for prefetches, which navigation may cancel
+    
+    def run(self):
+        if self.still_wanted is not None:
+            if not self.still_wanted((self.frame_id, (self.size.width(), self.size.height()))):
+                return
+        scaled = self.image.scaled(
+            self.size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        self.signals.frame_scaled.emit(self.generation, self.frame_id, self.size, scaled)
+
+
+class StartSliderCompat:
+    """Old start_slider interface on top of the range slider."""
+    
+    def __init__(self, range_slider: RangeSlider):
+        self.range_slider = range_slider
+    
+    def value(self):
+        return self.range_slider.get_values()[0]
+
+
+class EndSliderCompat:
+    """Old end_slider interface on top of the range slider."""
+    
+    def __init__(self, range_slider: RangeSlider):
+        self.range_slider = range_slider
+    
+    def value(self):
+        return self.range_slider.get_values()[1]
+
+
 class PreviewWidget(QWidget):
     """Enhanced preview widget with range slider, navigation slider, and frame deletion."""
     
@@ -9,28 +65,99 @@ class PreviewWidget(QWidget):
     frame_deleted = pyqtSignal(int)  # Emits deleted frame index
     frames_updated = pyqtSignal(list)  # Emits updated frames list
     
+    # Memory budget for scaled pixmaps (least recently used are dropped), in bytes
+    PIXMAP_CACHE_BYTES = 128 * 1024 * 1024
+    
+    # Idle time after scrubbing/playback before the frame is redrawn smoothly (ms)
+    SMOOTH_REDRAW_DELAY_MS = 200
+    
+    # Background scaling threads; kept low so pre-scaling a long recording does
+    # not occupy every core while the user starts editing
+    SCALE_THREADS = 2
+    
+    # Pause in a resize gesture after which the preview is rescaled (ms)
+    RESIZE_DEBOUNCE_MS = 100
+    
+    # Playback tick; the frame shown is derived from elapsed time, so this only bounds jitter (ms)
+    ANIMATION_TICK_MS = 4
+    
+    # Frames from the current one on kept smooth-scaled ahead of playback and stepping
+    PREFETCH_FRAMES = 8
+    
+    # Deletions that Ctrl+Z can restore
+    UNDO_LIMIT = 64
+    
+    # Label texts are applied at most this often; each setText re-lays out the widget (ms)
+    LABEL_UPDATE_INTERVAL_MS = 33
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.frames: List[QImage] = []
+        self._source_frames: List[QImage] = []  # Frames as passed to set_frames, before format conversion
         self.current_fps = 15
         self.current_frame_index = 0
         
+        # Stable id per frame (parallel to self.frames), so deleting a frame never re-keys the cache
+        self._frame_ids: List[int] = []
+        self._next_frame_id = 0
+        
         # Performance optimizations
-        self._cached_pixmaps: dict[int, QPixmap] = {}  # Cache scaled pixmaps
-        self._last_preview_size = QSize()
+        # Scaled pixmaps keyed by (frame id, label size), in LRU order
+        self._cached_pixmaps: OrderedDict[Tuple[int, Tuple[int, int]], QPixmap] = OrderedDict()
+        self._cache_bytes = 0
+        
+        # Background pre-scaling; results from an older generation (before a clear
+        # or resize) are dropped
+        self._scale_pool = QThreadPool()
+        self._scale_pool.setMaxThreadCount(self.SCALE_THREADS)
+        self._scale_generation = 0
+        self._scale_pending: set = set()
+        # Keys queued by the neighbour prefetch; moving away drops the ones no longer ahead
+        self._prefetch_keys: FrozenSet[Tuple[int, Tuple[int, int]]] = frozenset()
+        self._scale_signals = _ScaleSignals()
+        self._scale_signals.frame_scaled.connect(self._on_frame_scaled)
         self._update_timer = QTimer()  # Debounce updates
         self._update_timer.setSingleShot(True)
         self._update_timer.timeout.connect(self._delayed_update_preview)
         
-        # Animation timer
+        # Rescale once a resize gesture pauses instead of on every resize event
+        self._resize_timer = QTimer()
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self._on_resize_settled)
+        
+        # Fast (nearest) scaling while playing or scrubbing, smooth once idle
+        self._interactive = False
+        self._smooth_timer = QTimer()
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.timeout.connect(self._on_interaction_finished)
+        
+        # Coalesced label texts, applied together by _apply_label_texts
+        self._pending_labels: Dict[QLabel, str] = {}
+        self._label_timer = QTimer()
+        self._label_timer.setSingleShot(True)
+        self._label_timer.timeout.connect(self._apply_label_texts)
+        
+        # Animation timer; playback position follows the wall clock from the anchor frame
         self.animation_timer = QTimer()
+        self.animation_timer.setInterval(self.ANIMATION_TICK_MS)
+        self.animation_timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.animation_timer.timeout.connect(self._next_frame)
+        self._play_clock = QElapsedTimer()
+        self._play_anchor = 0  # Frame shown when the clock was (re)started
+        self._play_shown = 0  # Frame last shown by playback, to notice manual navigation
         
         # Track if we're in the middle of updating to prevent recursive calls
         self._updating = False
         
+        # Deleted frames as (index, source frame, converted frame, frame id), newest last
+        self._undo_stack: deque = deque(maxlen=self.UNDO_LIMIT)
+        
         self._init_ui()
         self._connect_signals()
+        
+        # Backward compatible start_slider / end_slider views, created once
+        self._start_compat = StartSliderCompat(self.range_slider)
+        self._end_compat = EndSliderCompat(self.range_slider)
     
     def _init_ui(self):
         """Initialize the UI components."""
@@ -100,12 +227,18 @@ class PreviewWidget(QWidget):
         
         self.delete_frame_btn = QPushButton("🗑 Delete Current Frame")
         self.delete_frame_btn.setStyleSheet("QPushButton { color: #d32f2f; }")
+        self.delete_frame_btn.setToolTip("Delete current frame (Ctrl+Z to undo)")
+        
+        # Deleting is undoable, so asking first is opt-in
+        self.confirm_delete_check = QCheckBox("Confirm")
+        self.confirm_delete_check.setToolTip("Ask before deleting a frame")
         
         nav_buttons_layout.addWidget(self.first_frame_btn)
         nav_buttons_layout.addWidget(self.prev_frame_btn)
         nav_buttons_layout.addWidget(self.next_frame_btn)
         nav_buttons_layout.addWidget(self.last_frame_btn)
         nav_buttons_layout.addStretch()
+        nav_buttons_layout.addWidget(self.confirm_delete_check)
         nav_buttons_layout.addWidget(self.delete_frame_btn)
         
         nav_layout.addLayout(nav_buttons_layout)
@@ -163,6 +296,7 @@ class PreviewWidget(QWidget):
     def _connect_signals(self):
         """Connect all signals to their handlers."""
         self.nav_slider.valueChanged.connect(self._on_nav_slider_changed)
+        self.nav_slider.sliderPressed.connect(self._mark_interactive)
         self.range_slider.rangeChanged.connect(self._on_range_changed)
         self.preview_fps_spin.valueChanged.connect(self._on_fps_changed)
         self.play_btn.clicked.connect(self._toggle_animation)
@@ -173,18 +307,32 @@ class PreviewWidget(QWidget):
         self.next_frame_btn.clicked.connect(self._go_to_next_frame)
         self.last_frame_btn.clicked.connect(lambda: self._go_to_frame(len(self.frames) - 1))
         self.delete_frame_btn.clicked.connect(self._delete_current_frame)
+        
+        self.undo_shortcut = QShortcut(QKeySequence(QKeySequence.StandardKey.Undo), self)
+        self.undo_shortcut.activated.connect(self._undo_delete)
     
     def set_frames(self, frames: List[QImage], fps: int = 15):
         """Set frames and update the preview."""
         if self._updating:
             return
+        
+        if self._is_current_frame_list(frames):
+            # Same frames re-sent; keep the cache and the navigation state
+            if fps != self.current_fps:
+                self.preview_fps_spin.setValue(fps)
+            return
             
         self._updating = True
         
         # Clear cache when frames change
         self._clear_pixmap_cache()
         
-        self.frames = frames.copy()
+        # Formats the smooth scaler handles directly; grabbed frames normally already are
+        self._source_frames = list(frames)
+        self._undo_stack.clear()
+        self.frames = [self._to_scalable_format(frame) for frame in frames]
+        self._frame_ids = list(range(self._next_frame_id, self._next_frame_id + len(self.frames)))
+        self._next_frame_id += len(self.frames)
         self.current_fps = fps
         self.preview_fps_spin.setValue(fps)
         self.current_frame_index = 0
@@ -194,27 +342,65 @@ class PreviewWidget(QWidget):
             self.nav_slider.setMaximum(len(self.frames) - 1)
             self.nav_slider.setValue(0)
             
-            # Update range slider
-            self.range_slider.set_range(0, len(self.frames) - 1)
+            # Update range slider; only set_values reports the new range
+            with QSignalBlocker(self.range_slider):
+                self.range_slider.set_range(0, len(self.frames) - 1)
             self.range_slider.set_values(0, len(self.frames) - 1)
             
             # Update UI state
             self._set_controls_enabled(True)
             
-            # Show first frame
+            # Show first frame, scale the following ones in the background
             self._update_preview_immediate()
+            self._prescale_frames()
         else:
             # No frames
             self.nav_slider.setMaximum(0)
             self.range_slider.set_range(0, 0)
             self._set_controls_enabled(False)
             self.preview_label.setText("No frames to preview")
-            self.frame_info_label.setText("Frame: 0 / 0")
+            self._set_label_text(self.frame_info_label, "Frame: 0 / 0")
             self._update_range_info(0, 0)
         
         self._stop_animation()
         self._updating = False
     
+    def _is_current_frame_list(self, frames: List[QImage]) -> bool:
+        """Whether frames holds the very QImage objects already shown (as passed in or as converted)."""
+        return len(frames) == len(self.frames) and all(
+            frame is shown or frame is source
+            for frame, shown, source in zip(frames, self.frames, self._source_frames)
+        )
+    
+    def invalidate_frame(self, index: int):
+        """Re-read a frame that was modified in place and drop its scaled pixmaps."""
+        if not 0 <= index < len(self.frames):
+            return
+        
+        label_size = self.preview_label.size()
+        key = (self._frame_ids[index], (label_size.width(), label_size.height()))
+        self._scale_pending.discard(key)
+        pixmap = self._cached_pixmaps.pop(key, None)
+        if pixmap is not None:
+            self._cache_bytes -= self._pixmap_bytes(pixmap)
+        
+        # A fresh id orphans any pixmap of the old content at other sizes; LRU drops those
+        self.frames[index] = self._to_scalable_format(self._source_frames[index])
+        self._frame_ids[index] = self._next_frame_id
+        self._next_frame_id += 1
+        
+        if index == self.current_frame_index:
+            self._update_preview_immediate()
+    
+    @staticmethod
+    def _to_scalable_format(frame: QImage) -> QImage:
+        """Return frame as RGB32 / premultiplied ARGB32 so scaling does not convert it every time."""
+        if frame.format() in (QImage.Format.Format_RGB32, QImage.Format.Format_ARGB32_Premultiplied):
+            return frame
+        if frame.hasAlphaChannel():
+            return frame.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+        return frame.convertToFormat(QImage.Format.Format_RGB32)
+    
     def _set_controls_enabled(self, enabled: bool):
         """Enable/disable all controls based on frame availability."""
         self.play_btn.setEnabled(enabled)
@@ -227,70 +413,185 @@ class PreviewWidget(QWidget):
     
     def _clear_pixmap_cache(self):
         """Clear the pixmap cache to free memory."""
+        self._cancel_prescale()
         self._cached_pixmaps.clear()
+        self._cache_bytes = 0
+    
+    def _cancel_prescale(self):
+        """Drop queued background scaling and ignore results still in flight."""
+        self._scale_generation += 1
+        self._scale_pool.clear()
+        self._scale_pending.clear()
+        self._prefetch_keys = frozenset()
+    
+    def _prescale_frames(self):
+        """Queue smooth scaling of as many frames, from the current one on, as fit the cache budget."""
+        if not self.frames:
+            return
+        
+        size = self.preview_label.size()
+        target = self.frames[0].size().scaled(size, Qt.AspectRatioMode.KeepAspectRatio)
+        frame_bytes = max(1, target.width() * target.height() * 4)
+        count = min(len(self.frames), self.PIXMAP_CACHE_BYTES // frame_bytes)
+        
+        for offset in range(count):
+            self._queue_scale((self.current_frame_index + offset) % len(self.frames), size)
+    
+    def _prefetch_neighbours(self):
+        """Keep the current and next PREFETCH_FRAMES frames queued for smooth scaling."""
+        if self.nav_slider.isSliderDown():
+            # Scrubbing jumps around; prefetch once the slider is released
+            return
+        
+        size = self.preview_label.size()
+        count = min(len(self.frames), self.PREFETCH_FRAMES + 1)
+        indices = [(self.current_frame_index + offset) % len(self.frames) for offset in range(count)]
+        window = {(self._frame_ids[idx], (size.width(), size.height())) for idx in indices}
+        
+        # Prefetches left behind are skipped by the pool if they have not started yet
+        for key in self._prefetch_keys - window:
+            self._scale_pending.discard(key)
+        kept = self._prefetch_keys & window
+        
+        queued = [self._queue_scale(idx, size, priority=1, still_wanted=self._is_prefetch_wanted)
+                  for idx in indices]
+        self._prefetch_keys = kept | frozenset(key for key in queued if key is not None)
+    
+    def _is_prefetch_wanted(self, key: Tuple[int, Tuple[int, int]]) -> bool:
+        """Called from pool threads; the key set is only ever replaced, never mutated."""
+        return key in self._prefetch_keys
+    
+    def _queue_scale(self, frame_index: int, size: QSize, priority: int = 0,
+                     still_wanted: Optional[Callable[[Tuple[int, Tuple[int, int]]], bool]] = None
+                     ) -> Optional[Tuple[int, Tuple[int, int]]]:
+        """Smooth-scale a frame on the pool unless it is cached or already queued; returns the queued key."""
+        frame_id = self._frame_ids[frame_index]
+        key = (frame_id, (size.width(), size.height()))
+        if key in self._cached_pixmaps or key in self._scale_pending:
+            return None
+        self._scale_pending.add(key)
+        self._scale_pool.start(_ScaleTask(
+            self._scale_signals, self._scale_generation, frame_id, self.frames[frame_index], size,
+            still_wanted
+        ), priority)
+        return key
+    
+    def _on_frame_scaled(self, generation: int, frame_id: int, size: QSize, image: QImage):
+        """Cache a frame scaled in the background (runs on the GUI thread)."""
+        if generation != self._scale_generation:
+            return
+        key = (frame_id, (size.width(), size.height()))
+        if key not in self._scale_pending:
+            # Frame was deleted while it was being scaled
+            return
+        self._scale_pending.discard(key)
+        if key in self._cached_pixmaps:
+            return
+        self._store_pixmap(key, QPixmap.fromImage(image))
+        
+        # Replace the fast placeholder if this frame is still on screen
+        if (self.current_frame_index < len(self._frame_ids)
+                and self._frame_ids[self.current_frame_index] == frame_id
+                and size == self.preview_label.size()):
+            self._update_preview_immediate()
+    
+    @staticmethod
+    def _pixmap_bytes(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+    
+    def _store_pixmap(self, key: Tuple[int, Tuple[int, int]], pixmap: QPixmap):
+        """Insert a scaled pixmap, evicting least recently used ones beyond the memory budget."""
+        self._cached_pixmaps[key] = pixmap
+        self._cache_bytes += self._pixmap_bytes(pixmap)
+        while self._cache_bytes > self.PIXMAP_CACHE_BYTES and len(self._cached_pixmaps) > 1:
+            _, evicted = self._cached_pixmaps.popitem(last=False)
+            self._cache_bytes -= self._pixmap_bytes(evicted)
     
     def _get_cached_pixmap(self, frame_index: int) -> Optional[QPixmap]:
-        """Get cached pixmap for frame, creating if necessary."""
-        if frame_index not in self._cached_pixmaps:
-            if frame_index < len(self.frames):
-                current_size = self.preview_label.size()
-                
-                # Only cache if size hasn't changed
-                if current_size == self._last_preview_size:
-                    frame = self.frames[frame_index]
-                    scaled_pixmap = QPixmap.fromImage(frame).scaled(
-                        current_size,
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-                    self._cached_pixmaps[frame_index] = scaled_pixmap
-                    return scaled_pixmap
-                else:
-                    # Size changed, clear cache and update
-                    self._clear_pixmap_cache()
-                    self._last_preview_size = current_size
-                    return None
-        
-        return self._cached_pixmaps.get(frame_index)
+        """Get the cached smooth pixmap for frame at the current label size, or a fast placeholder."""
+        if frame_index >= len(self.frames):
+            return None
+        
+        current_size = self.preview_label.size()
+        key = (self._frame_ids[frame_index], (current_size.width(), current_size.height()))
+        
+        pixmap = self._cached_pixmaps.get(key)
+        if pixmap is not None:
+            self._cached_pixmaps.move_to_end(key)
+            return pixmap
+        
+        if not self._interactive:
+            # The smooth version is scaled on the pool and swapped in by _on_frame_scaled
+            self._queue_scale(frame_index, current_size, priority=2)
+        
+        # Cheap nearest-neighbour placeholder; not cached
+        return self._scale_frame(frame_index, current_size, Qt.TransformationMode.FastTransformation)
+    
+    def _scale_frame(self, frame_index: int, size: QSize, mode: Qt.TransformationMode) -> QPixmap:
+        """Scale a frame to fit size on the CPU, then upload only the small result as a pixmap."""
+        scaled_image = self.frames[frame_index].scaled(size, Qt.AspectRatioMode.KeepAspectRatio, mode)
+        return QPixmap.fromImage(scaled_image)
     
     def _update_preview_immediate(self):
         """Immediately update the preview image."""
         if not self.frames or self.current_frame_index >= len(self.frames):
             return
         
-        # Try to get cached pixmap first
         pixmap = self._get_cached_pixmap(self.current_frame_index)
         
-        if pixmap is None:
-            # Create new pixmap
-            frame = self.frames[self.current_frame_index]
-            pixmap = QPixmap.fromImage(frame).scaled(
-                self.preview_label.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-        
         self.preview_label.setPixmap(pixmap)
+        self._prefetch_neighbours()
         
         # Update frame info
-        self.frame_info_label.setText(
-            f"Frame: {self.current_frame_index + 1} / {len(self.frames)}"
+        self._set_label_text(
+            self.frame_info_label, f"Frame: {self.current_frame_index + 1} / {len(self.frames)}"
         )
     
+    def _set_label_text(self, label: QLabel, text: str):
+        """Queue a label text; all queued texts are applied together on the next label tick."""
+        self._pending_labels[label] = text
+        if not self._label_timer.isActive():
+            self._label_timer.start(self.LABEL_UPDATE_INTERVAL_MS)
+    
+    def _apply_label_texts(self):
+        """Apply queued label texts, one setText per label."""
+        pending, self._pending_labels = self._pending_labels, {}
+        for label, text in pending.items():
+            label.setText(text)
+    
     def _update_preview(self):
-        """Debounced preview update."""
-        self._update_timer.stop()
-        self._update_timer.start(16)  # ~60fps update limit
+        """Coalesced preview update: bursts of requests render once per 16 ms slot."""
+        if not self._update_timer.isActive():
+            self._update_timer.start(16)  # ~60fps update limit
     
     def _delayed_update_preview(self):
         """Delayed preview update for performance."""
         self._update_preview_immediate()
     
+    def _mark_interactive(self):
+        """Use fast scaling until playback and scrubbing have been idle for a moment."""
+        self._interactive = True
+        if not self.animation_timer.isActive():
+            self._smooth_timer.start(self.SMOOTH_REDRAW_DELAY_MS)
+    
+    def _on_interaction_finished(self):
+        """Redraw the current frame with smooth scaling."""
+        if self.animation_timer.isActive():
+            return
+        if self.nav_slider.isSliderDown():
+            # Still scrubbing, just holding still for a moment
+            self._smooth_timer.start(self.SMOOTH_REDRAW_DELAY_MS)
+            return
+        self._interactive = False
+        self._update_preview_immediate()
+    
     def _go_to_frame(self, frame_index: int):
         """Navigate to specific frame."""
         if self.frames and 0 <= frame_index < len(self.frames):
             self.current_frame_index = frame_index
-            self.nav_slider.setValue(frame_index)
+            # The preview is redrawn right below, not again via valueChanged
+            with QSignalBlocker(self.nav_slider):
+                self.nav_slider.setValue(frame_index)
             self._update_preview_immediate()
     
     def _go_to_previous_frame(self):
@@ -307,6 +608,7 @@ class PreviewWidget(QWidget):
         """Handle navigation slider change."""
         if not self._updating and self.frames and 0 <= value < len(self.frames):
             self.current_frame_index = value
+            self._mark_interactive()
             self._update_preview()
     
     def _on_range_changed(self, start, end):
@@ -315,20 +617,21 @@ class PreviewWidget(QWidget):
     
     def _update_range_info(self, start: int, end: int):
         """Update range information labels."""
-        self.range_start_label.setText(f"Start: {start + 1}")
-        self.range_end_label.setText(f"End: {end + 1}")
+        self._set_label_text(self.range_start_label, f"Start: {start + 1}")
+        self._set_label_text(self.range_end_label, f"End: {end + 1}")
         
         if self.current_fps > 0:
             duration = (end - start + 1) / self.current_fps
-            self.range_duration_label.setText(f"Duration: {duration:.1f}s")
+            self._set_label_text(self.range_duration_label, f"Duration: {duration:.1f}s")
         else:
-            self.range_duration_label.setText("Duration: 0.0s")
+            self._set_label_text(self.range_duration_label, "Duration: 0.0s")
     
     def _on_fps_changed(self, fps):
         """Handle FPS change."""
         self.current_fps = fps
         if self.animation_timer.isActive():
-            self.animation_timer.setInterval(1000 // fps)
+            # Continue at the new speed from the frame on screen
+            self._restart_play_clock()
         
         # Update duration display
         start, end = self.range_slider.get_values()
@@ -346,13 +649,23 @@ class PreviewWidget(QWidget):
         if not self.frames:
             return
         
-        self.animation_timer.setInterval(1000 // self.current_fps)
+        self._restart_play_clock()
         self.animation_timer.start()
+        self._smooth_timer.stop()
+        self._interactive = True
         self.play_btn.setText("▮▮")
     
+    def _restart_play_clock(self):
+        """Measure playback time from the current frame."""
+        self._play_anchor = self.current_frame_index
+        self._play_shown = self.current_frame_index
+        self._play_clock.start()
+    
     def _stop_animation(self):
         """Stop animation playback."""
         self.animation_timer.stop()
+        if self._interactive:
+            self._smooth_timer.start(self.SMOOTH_REDRAW_DELAY_MS)
         self.play_btn.setText("▶ Play")
     
     def _next_frame(self):
@@ -360,19 +673,37 @@ class PreviewWidget(QWidget):
         if not self.frames:
             return
         
+        if self.current_frame_index != self._play_shown:
+            # Navigated by hand during playback; continue from there
+            self._restart_play_clock()
+        
         start, end = self.range_slider.get_values()
         
-        # Only animate within trim range
-        if self.current_frame_index >= end:
+        # Frames due by now; late ticks skip frames instead of slowing playback down
+        advanced = self._play_clock.elapsed() * self.current_fps // 1000
+        if advanced == 0:
+            return
+        
+        # Only animate within trim range; past its end playback wraps to the start
+        anchor = min(self._play_anchor, end)
+        target = anchor + advanced
+        if target > end:
             if self.loop_check.isChecked():
-                self.current_frame_index = start
-            else:
+                target = start + (target - end - 1) % (end - start + 1)
+            elif self.current_frame_index >= end:
                 self._stop_animation()
                 return
-        else:
-            self.current_frame_index += 1
+            else:
+                # Show the last frame before stopping, even if a late tick overshot it
+                target = end
+        
+        if target == self.current_frame_index:
+            return
+        self.current_frame_index = target
+        self._play_shown = target
         
-        self.nav_slider.setValue(self.current_frame_index)
+        with QSignalBlocker(self.nav_slider):
+            self.nav_slider.setValue(self.current_frame_index)
         self._update_preview_immediate()
     
     def _delete_current_frame(self):
@@ -385,99 +716,111 @@ class PreviewWidget(QWidget):
                               "Cannot delete the last frame.\nAt least one frame is required.")
             return
         
-        # Confirm deletion for safety
-        reply = QMessageBox.question(
-            self, "Delete Frame",
-            f"Delete frame {self.current_frame_index + 1} of {len(self.frames)}?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
-        )
-        
-        if reply != QMessageBox.StandardButton.Yes:
-            return
+        if self.confirm_delete_check.isChecked():
+            reply = QMessageBox.question(
+                self, "Delete Frame",
+                f"Delete frame {self.current_frame_index + 1} of {len(self.frames)}?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No
+            )
+            
+            if reply != QMessageBox.StandardButton.Yes:
+                return
         
         deleted_index = self.current_frame_index
         
-        # Remove from cache first
-        if deleted_index in self._cached_pixmaps:
-            del self._cached_pixmaps[deleted_index]
+        # Keep the frame and its id so undo can restore it with its cached pixmaps
+        self._undo_stack.append((
+            deleted_index,
+            self._source_frames[deleted_index],
+            self.frames[deleted_index],
+            self._frame_ids[deleted_index]
+        ))
         
-        # Shift cache indices
-        new_cache = {}
-        for idx, pixmap in self._cached_pixmaps.items():
-            if idx > deleted_index:
-                new_cache[idx - 1] = pixmap
-            elif idx < deleted_index:
-                new_cache[idx] = pixmap
-        self._cached_pixmaps = new_cache
-        
-        # Delete the frame
+        # Delete the frame; other frames keep their ids, so their cached pixmaps stay valid
         del self.frames[deleted_index]
+        del self._source_frames[deleted_index]
+        del self._frame_ids[deleted_index]
         
         # Update navigation - go to previous frame if possible
         if self.current_frame_index > 0:
             self.current_frame_index -= 1
-        elif len(self.frames) > 0:
-            self.current_frame_index = 0
         
-        # Update UI
-        if self.frames:
-            # Update sliders
-            self.nav_slider.setMaximum(len(self.frames) - 1)
-            self.nav_slider.setValue(self.current_frame_index)
-            
-            # Update range slider
-            old_start, old_end = self.range_slider.get_values()
-            self.range_slider.set_range(0, len(self.frames) - 1)
-            
-            # Adjust range values if necessary
-            new_start = min(old_start, len(self.frames) - 1)
-            new_end = min(old_end, len(self.frames) - 1)
-            if new_end >= len(self.frames):
-                new_end = len(self.frames) - 1
-            if new_start > new_end:
-                new_start = new_end
-            
-            self.range_slider.set_values(new_start, new_end)
-            
-            self._update_preview_immediate()
-        else:
-            # No frames left
-            self.set_frames([], self.current_fps)
+        self._sync_frame_count()
         
         # Emit signals for parent to handle
         self.frame_deleted.emit(deleted_index)
         self.frames_updated.emit(self.frames)
     
+    def _undo_delete(self):
+        """Restore the most recently deleted frame at its old position."""
+        if not self._undo_stack:
+            return
+        
+        index, source_frame, frame, frame_id = self._undo_stack.pop()
+        index = min(index, len(self.frames))
+        self.frames.insert(index, frame)
+        self._source_frames.insert(index, source_frame)
+        self._frame_ids.insert(index, frame_id)
+        self.current_frame_index = index
+        
+        self._sync_frame_count()
+        self.frames_updated.emit(self.frames)
+    
+    def _sync_frame_count(self):
+        """Fit the sliders to the current number of frames and redraw."""
+        last = len(self.frames) - 1
+        
+        # Update sliders; the preview is redrawn below, not via valueChanged
+        with QSignalBlocker(self.nav_slider):
+            self.nav_slider.setMaximum(last)
+            self.nav_slider.setValue(self.current_frame_index)
+        
+        # Update range slider; only set_values reports the new range
+        old_start, old_end = self.range_slider.get_values()
+        with QSignalBlocker(self.range_slider):
+            self.range_slider.set_range(0, last)
+        
+        # Adjust range values if necessary
+        new_end = min(old_end, last)
+        new_start = min(old_start, new_end)
+        self.range_slider.set_values(new_start, new_end)
+        
+        self._update_preview_immediate()
+    
+    def shutdown(self):
+        """Stop playback and background scaling; call before the widget is destroyed."""
+        self._stop_animation()
+        self._smooth_timer.stop()
+        self._cancel_prescale()
+        # Tasks already running still emit into _scale_signals, so wait for them
+        self._scale_pool.waitForDone()
+    
+    def closeEvent(self, event):
+        """Drain background scaling when shown as its own window."""
+        self.shutdown()
+        super().closeEvent(event)
+    
     def resizeEvent(self, event):
-        """Handle resize events by clearing pixmap cache."""
+        """Handle resize events; the rescale waits until the resize pauses."""
         super().resizeEvent(event)
-        # Clear cache on resize as pixmap sizes are no longer valid
+        self._resize_timer.start(self.RESIZE_DEBOUNCE_MS)
+    
+    def _on_resize_settled(self):
+        """Rescale the preview for the new size."""
+        # Clear cache as pixmap sizes are no longer valid
         self._clear_pixmap_cache()
         if self.frames:
-            self._update_preview()
+            self._update_preview_immediate()
+            self._prescale_frames()
     
     # Backward compatibility methods (improved)
     @property
     def start_slider(self):
         """Backward compatibility for start_slider."""
-        class StartSliderCompat:
-            def __init__(self, range_slider):
-                self.range_slider = range_slider
-            
-            def value(self):
-                return self.range_slider.get_values()[0]
-        
-        return StartSliderCompat(self.range_slider)
+        return self._start_compat
     
     @property
     def end_slider(self):
         """Backward compatibility for end_slider."""
-        class EndSliderCompat:
-            def __init__(self, range_slider):
-                self.range_slider = range_slider
-            
-            def value(self):
-                return self.range_slider.get_values()[1]
-        
-        return EndSliderCompat(self.range_slider)
\ No newline at end of file
+        return self._end_compat
\ No newline at end of file
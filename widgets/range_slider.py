@@ -1,4 +1,4 @@
-from utils.qt_imports import *
+from utils.qt_imports import QWidget, QPainter, QColor, QPen, QBrush, QPixmap, QRect, Qt, pyqtSignal
 
 class RangeSlider(QWidget):
     """Custom Range Slider Widget for trim functionality."""
@@ -16,13 +16,33 @@ class RangeSlider(QWidget):
         self.track_height = 4
         self.active_handle = None  # 'start', 'end', or None
         
+        # Paint resources, built once instead of per paint
+        self._track_color = QColor(200, 200, 200)
+        self._active_color = QColor(70, 130, 180)
+        self._handle_brush = QBrush(QColor(50, 100, 150))
+        self._handle_pen = QPen(QColor(30, 80, 130), 2)
+        self._handle_pixmap = None  # Pre-rendered handle, see _get_handle_pixmap
+        
         self.setMinimumHeight(30)
         self.setMouseTracking(True)
+        self._update_geometry()
         
+    def _update_geometry(self):
+        """Cache the pixel mapping; depends only on widget size and range."""
+        self._usable_width = self.width() - 2 * self.handle_radius
+        self._center_y = self.height() // 2
+        value_span = self.maximum - self.minimum
+        self._pixels_per_value = self._usable_width / value_span if value_span > 0 else 0.0
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_geometry()
+    
     def set_range(self, minimum, maximum):
         """Set the range of the slider."""
         self.minimum = minimum
         self.maximum = maximum
+        self._update_geometry()
         self.start_value = max(minimum, min(self.start_value, maximum))
         self.end_value = max(minimum, min(self.end_value, maximum))
         self.update()
@@ -43,27 +63,21 @@ class RangeSlider(QWidget):
     
     def value_to_pixel(self, value):
         """Convert value to pixel position."""
-        if self.maximum <= self.minimum:
-            return self.handle_radius
-        
-        usable_width = self.width() - 2 * self.handle_radius
-        ratio = (value - self.minimum) / (self.maximum - self.minimum)
-        return self.handle_radius + ratio * usable_width
+        return self.handle_radius + (value - self.minimum) * self._pixels_per_value
     
     def pixel_to_value(self, pixel):
         """Convert pixel position to value."""
         if self.maximum <= self.minimum:
             return self.minimum
         
-        usable_width = self.width() - 2 * self.handle_radius
-        ratio = (pixel - self.handle_radius) / usable_width
+        ratio = (pixel - self.handle_radius) / self._usable_width
         ratio = max(0, min(1, ratio))
         return int(self.minimum + ratio * (self.maximum - self.minimum))
     
     def get_handle_rect(self, value):
         """Get rectangle for handle at given value."""
         center_x = self.value_to_pixel(value)
-        center_y = self.height() // 2
+        center_y = self._center_y
         return QRect(
             int(center_x - self.handle_radius),
             int(center_y - self.handle_radius),
@@ -71,42 +85,63 @@ class RangeSlider(QWidget):
             self.handle_radius * 2
         )
     
+    def _get_handle_pixmap(self) -> QPixmap:
+        """Antialiased handle glyph, rendered once per device pixel ratio.
+        
+        The pixmap has a margin of one pen width around the handle rect so the
+        outer half of the outline is not clipped.
+        """
+        ratio = self.devicePixelRatioF()
+        if self._handle_pixmap is None or self._handle_pixmap.devicePixelRatio() != ratio:
+            margin = self._handle_pen.width()
+            size = self.handle_radius * 2
+            pixmap = QPixmap(round((size + 2 * margin) * ratio), round((size + 2 * margin) * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setBrush(self._handle_brush)
+            painter.setPen(self._handle_pen)
+            painter.drawEllipse(QRect(margin, margin, size, size))
+            painter.end()
+            
+            self._handle_pixmap = pixmap
+        return self._handle_pixmap
+    
     def paintEvent(self, event):
         """Paint the range slider."""
+        # Only pixel-aligned fills and the pre-rendered (already antialiased) handle
+        # are drawn, so the painter needs no render hints or pen/brush state
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Track background
+        track_top = self._center_y - self.track_height // 2
         track_rect = QRect(
             self.handle_radius,
-            self.height() // 2 - self.track_height // 2,
-            self.width() - 2 * self.handle_radius,
+            track_top,
+            self._usable_width,
             self.track_height
         )
-        painter.fillRect(track_rect, QColor(200, 200, 200))
+        painter.fillRect(track_rect, self._track_color)
         
         # Active range
         start_x = self.value_to_pixel(self.start_value)
         end_x = self.value_to_pixel(self.end_value)
         active_rect = QRect(
             int(start_x),
-            self.height() // 2 - self.track_height // 2,
+            track_top,
             int(end_x - start_x),
             self.track_height
         )
-        painter.fillRect(active_rect, QColor(70, 130, 180))
+        painter.fillRect(active_rect, self._active_color)
         
-        # Start handle
-        start_rect = self.get_handle_rect(self.start_value)
-        painter.setBrush(QColor(50, 100, 150))
-        painter.setPen(QPen(QColor(30, 80, 130), 2))
-        painter.drawEllipse(start_rect)
-        
-        # End handle
-        end_rect = self.get_handle_rect(self.end_value)
-        painter.setBrush(QColor(50, 100, 150))
-        painter.setPen(QPen(QColor(30, 80, 130), 2))
-        painter.drawEllipse(end_rect)
+        # Handles are blitted from the pre-rendered glyph
+        handle = self._get_handle_pixmap()
+        margin = self._handle_pen.width()
+        for value in (self.start_value, self.end_value):
+            handle_rect = self.get_handle_rect(value)
+            painter.drawPixmap(handle_rect.x() - margin, handle_rect.y() - margin, handle)
     
     def mousePressEvent(self, event):
         """Handle mouse press."""
@@ -138,12 +173,17 @@ class RangeSlider(QWidget):
         """Handle mouse move."""
         if self.active_handle:
             new_value = self.pixel_to_value(event.pos().x())
+            old_values = (self.start_value, self.end_value)
             
             if self.active_handle == 'start':
                 self.start_value = min(new_value, self.end_value)
             elif self.active_handle == 'end':
                 self.end_value = max(new_value, self.start_value)
             
+            # Several pixels map to the same value; nothing to do until it changes
+            if (self.start_value, self.end_value) == old_values:
+                return
+            
             self.update()
             self.rangeChanged.emit(self.start_value, self.end_value)
     